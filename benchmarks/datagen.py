@@ -0,0 +1,97 @@
+"""Deterministic synthetic data for the repository benchmarks."""
+
+import json
+import random
+import string
+from pathlib import Path
+
+_SEVERITIES = ("low", "medium", "high", "critical")
+_STATUSES = ("open", "triaged", "resolved")
+_DOMAINS = ("example.com", "corp.com", "acme.org", "siem.local", "mail.test")
+
+
+def _word(rng: random.Random, lo: int = 3, hi: int = 10) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(lo, hi))).capitalize()
+
+
+def players(n: int, seed: int = 0) -> list[dict]:
+    """n player dicts shaped like player_db's PLAYERS."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i,
+            "firstName": _word(rng),
+            "lastName": _word(rng),
+            "weight": rng.randint(50, 140),
+            "height": rng.randint(150, 215),
+            "manager_id": rng.choice((1, 2, None)),
+            "team_id": rng.choice((1, 2, None)),
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def incidents(n: int, seed: int = 0) -> list[dict]:
+    """n incident dicts shaped like security_analyst's store rows."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(1, n + 1):
+        first = _word(rng)
+        rows.append(
+            {
+                "id": i,
+                "reporter": {
+                    "firstName": first,
+                    "lastName": _word(rng),
+                    "email": f"{first.lower()}{i}@{rng.choice(_DOMAINS)}",
+                },
+                "status": rng.choice(_STATUSES),
+                "severity": rng.choice(_SEVERITIES),
+            }
+        )
+    return rows
+
+
+def names_file(path: Path, lines: int, seed: int = 0) -> Path:
+    """Names file for name_cleaner: ~20% repeats, ~5% invalid, random padding and case."""
+    rng = random.Random(seed)
+    pool = [_word(rng) for _ in range(max(1, lines * 4 // 5))]
+    with path.open("w", encoding="utf-8") as f:
+        for _ in range(lines):
+            if rng.random() < 0.05:
+                f.write(f"{rng.randint(0, 999)}!\n")
+            else:
+                name = rng.choice(pool)
+                f.write(f"  {name.upper() if rng.random() < 0.3 else name} \n")
+    return path
+
+
+def nested_set(width: int, depth: int, seed: int = 0, fanout: int = 3) -> frozenset:
+    """Random nested frozenset: `width` strings plus `fanout` children per level, `depth` levels."""
+    rng = random.Random(seed)
+
+    def build(level: int) -> frozenset:
+        items = {f"s{rng.randrange(width * 10)}" for _ in range(width)}
+        if level > 0:
+            items.update(build(level - 1) for _ in range(fanout))
+        return frozenset(items)
+
+    return build(depth)
+
+
+def copy_nested(s: frozenset) -> frozenset:
+    """Structurally equal copy of a nested frozenset sharing no sub-objects."""
+    return frozenset(copy_nested(x) if isinstance(x, frozenset) else "".join(x) for x in s)
+
+
+def config_file(path: Path, keys: int, seed: int = 0) -> Path:
+    """JSON config with `keys` top-level entries, a quarter of them nested objects."""
+    rng = random.Random(seed)
+    config = {"message": "Hello from config!"}
+    for i in range(keys):
+        if i % 4 == 0:
+            config[f"section{i}"] = {f"k{j}": rng.randint(0, 1000) for j in range(8)}
+        else:
+            config[f"key{i}"] = _word(rng)
+    path.write_text(json.dumps(config), encoding="utf-8")
+    return path
@@ -0,0 +1,248 @@
+"""Repository benchmark harness: time and peak memory of each sub-project's hot functions.
+
+    python benchmarks/run.py                          # small scale, compare to baseline if present
+    python benchmarks/run.py --scale small --scale medium --save-baseline
+    python benchmarks/run.py --only nested_set --threshold 0.10
+
+Runs offline on synthetic data (benchmarks/datagen.py). Exits with status 1
+when any benchmark is slower, or uses more peak memory, than the stored
+baseline by more than the threshold.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import datagen  # noqa: E402
+
+SCALES = ("small", "medium", "large")
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# name -> (size per scale, setup(size, tmp_dir) -> zero-argument callable to time)
+BENCHMARKS: dict[str, tuple[tuple[int, int, int], Callable[[int, Path], Callable[[], object]]]] = {}
+
+
+def benchmark(name: str, sizes: tuple[int, int, int]):
+    """Register a setup function under name, with one input size per scale."""
+
+    def register(setup):
+        BENCHMARKS[name] = (sizes, setup)
+        return setup
+
+    return register
+
+
+def load(project: str | None, module: str = "main"):
+    """
+    Import <project>/src/<module>.py under a unique name.
+
+    Every sub-project has its own main.py, so they are loaded by path; the
+    project's src dir goes on sys.path for its sibling imports.
+    """
+    src = ROOT / project / "src" if project else ROOT / "src"
+    name = f"_bench_{project or 'root'}_{module}"
+    if name in sys.modules:
+        return sys.modules[name]
+    if str(src) not in sys.path:
+        sys.path.insert(0, str(src))
+    spec = importlib.util.spec_from_file_location(name, src / f"{module}.py")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return mod
+
+
+# --- Benchmarks ---
+
+
+@benchmark("player_db.get_players", (1_000, 10_000, 100_000))
+def _get_players(size: int, tmp: Path):
+    mod = load("player_db")
+    mod.PLAYERS = datagen.players(size)
+    return lambda: mod.get_players(isAdmin="true", sort="weight", page=1, limit=100)
+
+
+@benchmark("security_analyst.get_incidents", (1_000, 10_000, 100_000))
+def _get_incidents(size: int, tmp: Path):
+    mod = load("security_analyst")
+    mod.STORE = mod.IncidentStore(datagen.incidents(size), severities=mod.VALID_SEVERITY)
+    return lambda: mod.get_incidents(
+        includePII="false",
+        severity="high",
+        status="open",
+        reporterDomain=None,
+        cursor=None,
+        limit=None,
+        format="json",
+    )
+
+
+@benchmark("name_cleaner.name_cleaner", (10_000, 100_000, 1_000_000))
+def _name_cleaner(size: int, tmp: Path):
+    mod = load("name_cleaner")
+    path = datagen.names_file(tmp / "names.txt", size)
+
+    def run():
+        # name_cleaner prints whole collections; discard them without buffering
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            mod.name_cleaner(str(path))
+
+    return run
+
+
+@benchmark("name_cleaner.name_cleaner_stream", (10_000, 100_000, 1_000_000))
+def _name_cleaner_stream(size: int, tmp: Path):
+    mod = load("name_cleaner")
+    path = datagen.names_file(tmp / "names.txt", size)
+    return lambda: mod.name_cleaner_stream(str(path), str(tmp / "out"))
+
+
+@benchmark("nested_set.nested_sets_equal", (100, 1_000, 10_000))
+def _nested_sets_equal(size: int, tmp: Path):
+    mod = load("nested_set", "set_compare")
+    a = datagen.nested_set(size, depth=2)
+    b = datagen.copy_nested(a)
+    return lambda: mod.nested_sets_equal(a, b)
+
+
+@benchmark("src.parse_config", (10, 1_000, 10_000))
+def _parse_config(size: int, tmp: Path):
+    mod = load(None, "utils")
+    path = datagen.config_file(tmp / "config.json", size)
+    return lambda: mod.parse_config(str(path))
+
+
+@benchmark("src.ConfigService.get", (10, 1_000, 10_000))
+def _config_service_get(size: int, tmp: Path):
+    mod = load(None, "utils")
+    service = mod.ConfigService(str(datagen.config_file(tmp / "config.json", size)))
+    return lambda: service.get("section0.k0")
+
+
+# --- Harness ---
+
+
+MIN_RUN_TIME = 0.05
+
+
+def measure(fn: Callable[[], object], repeat: int) -> dict:
+    """
+    Best and median time per call over `repeat` runs, plus peak traced memory of one call.
+
+    Like timeit.autorange, each run loops enough calls to last MIN_RUN_TIME
+    so microsecond-scale functions are not lost in timer noise.
+    """
+    start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - start
+    number = max(1, int(MIN_RUN_TIME / first)) if first > 0 else 1000
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"time": min(times), "median": statistics.median(times), "peak_kb": peak / 1024}
+
+
+def run(scales: list[str], only: list[str], repeat: int) -> tuple[dict, list[str]]:
+    """Results keyed "name@size", and skipped benchmarks with the reason."""
+    results, skipped = {}, []
+    for name, (sizes, setup) in BENCHMARKS.items():
+        if only and not any(o in name for o in only):
+            continue
+        for scale in scales:
+            size = sizes[SCALES.index(scale)]
+            key = f"{name}@{size}"
+            with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+                try:
+                    fn = setup(size, Path(tmp))
+                except ImportError as e:
+                    skipped.append(f"{key}: {e}")
+                    break
+                results[key] = measure(fn, repeat)
+            print(f"{key:<48} {results[key]['time'] * 1000:10.3f} ms  {results[key]['peak_kb']:10.1f} KiB", flush=True)
+    return results, skipped
+
+
+def compare(results: dict, baseline: dict, threshold: float, memory_threshold: float) -> list[str]:
+    """Regressions: entries whose best time or peak memory exceeds the baseline by more than the threshold."""
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, limit in (("time", threshold), ("peak_kb", memory_threshold)):
+            if base[metric] > 0 and current[metric] > base[metric] * (1 + limit):
+                regressions.append(f"{key} {metric}: {base[metric]:.6g} -> {current[metric]:.6g} (+{current[metric] / base[metric] - 1:.0%})")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Repository benchmark harness")
+    parser.add_argument("--scale", action="append", choices=SCALES, help="Input scale; may be repeated (default: small)")
+    parser.add_argument("--only", action="append", default=[], help="Run benchmarks whose name contains this; may be repeated")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help=f"Baseline JSON (default: {DEFAULT_BASELINE.relative_to(ROOT)})")
+    parser.add_argument("--save-baseline", action="store_true", help="Merge these results into the baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed time increase as a fraction (default: 0.25)")
+    parser.add_argument("--memory-threshold", type=float, default=0.25, help="Allowed peak memory increase as a fraction (default: 0.25)")
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and their sizes, then exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (sizes, _) in BENCHMARKS.items():
+            print(f"{name:<40} " + "  ".join(f"{s}={n}" for s, n in zip(SCALES, sizes)))
+        return 0
+
+    results, skipped = run(args.scale or ["small"], args.only, args.repeat)
+    for reason in skipped:
+        print(f"skipped {reason}")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    stored = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    if args.save_baseline:
+        stored.setdefault("results", {}).update(results)
+        stored["python"] = platform.python_version()
+        stored["machine"] = platform.machine()
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"baseline saved to {args.baseline}")
+        return 0
+    if not stored:
+        print(f"no baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    regressions = compare(results, stored.get("results", {}), args.threshold, args.memory_threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print("no regressions against baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""Compare sequential (streaming) and parallel name cleaning on a synthetic corpus.
+
+    python benchmarks/bench_parallel.py --lines 2000000 --workers 4
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from corpus import write_corpus  # noqa: E402
+from main import name_cleaner_parallel, name_cleaner_stream  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--unique", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=8 << 20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(tmp) / "names.txt"
+        write_corpus(corpus, args.lines, args.unique)
+        runs = {
+            "sequential": lambda: name_cleaner_stream(str(corpus), str(Path(tmp) / "seq")),
+            "parallel": lambda: name_cleaner_parallel(
+                str(corpus), str(Path(tmp) / "par"), workers=args.workers, shard_size=args.shard_size
+            ),
+        }
+        results = {}
+        for label, run in runs.items():
+            start = time.perf_counter()
+            results[label] = run()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<11} {elapsed:8.3f}s  {args.lines / elapsed:12,.0f} lines/s  {results[label]}")
+        assert results["sequential"] == results["parallel"], "parallel counts differ from sequential"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Measure name-cleaning throughput (lines/s) for each normalization rule set on a synthetic corpus.
+
+    python benchmarks/bench_rules.py --lines 1000000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from corpus import write_corpus  # noqa: E402
+from rules import Rules, clean_names  # noqa: E402
+
+RULE_SETS = {
+    "default": Rules(),
+    "casefold": Rules(casefold=True),
+    "nfkc+casefold": Rules(nfkc=True, casefold=True),
+    "hyphens+apostrophes": Rules(hyphens=True, apostrophes=True),
+    "all": Rules(nfkc=True, casefold=True, hyphens=True, apostrophes=True),
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--unique", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(tmp) / "names.txt"
+        write_corpus(corpus, args.lines, args.unique)
+        for label, rules in RULE_SETS.items():
+            stats = Counter()
+            start = time.perf_counter()
+            with corpus.open(encoding="utf-8") as f:
+                for _ in clean_names(f, rules, stats):
+                    pass
+            elapsed = time.perf_counter() - start
+            print(f"{label:<20} {elapsed:8.3f}s  {args.lines / elapsed:12,.0f} lines/s  {dict(stats)}")
+
+
+if __name__ == "__main__":
+    main()
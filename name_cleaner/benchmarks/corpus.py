@@ -0,0 +1,35 @@
+"""Synthetic name corpora for the name_cleaner benchmarks."""
+
+import random
+import string
+from pathlib import Path
+
+# Letters beyond ASCII plus compatibility forms, so the Unicode rules have work to do
+_EXTRA_LETTERS = "éüßøñçÉÜ" + "ＡＢＣ"
+_SEPARATORS = "-'’–"
+
+
+def write_corpus(path: Path, lines: int, unique: int, seed: int = 0) -> None:
+    """
+    Write `lines` names drawn from `unique` distinct ones.
+
+    Names get random padding and case; ~10% contain a Unicode letter, ~10% an
+    internal hyphen/apostrophe variant, and ~5% of rows are invalid.
+    """
+    rng = random.Random(seed)
+    letters = string.ascii_letters
+    pool = []
+    for _ in range(unique):
+        name = "".join(rng.choices(letters, k=rng.randint(3, 12)))
+        roll = rng.random()
+        if roll < 0.1:
+            name += rng.choice(_EXTRA_LETTERS)
+        elif roll < 0.2:
+            name = name[:2] + rng.choice(_SEPARATORS) + name[2:]
+        pool.append(name)
+    with path.open("w", encoding="utf-8") as f:
+        for _ in range(lines):
+            if rng.random() < 0.05:
+                f.write(f"{rng.randint(0, 9999)}@\n")
+            else:
+                f.write(f"  {rng.choice(pool)} \n")
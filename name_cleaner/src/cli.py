@@ -0,0 +1,60 @@
+import argparse
+import sys
+from collections import Counter
+
+try:
+    from .main import name_cleaner_parallel, name_cleaner_stream  # When run as module: python -m src.cli
+    from .rules import RULE_NAMES, Rules, clean_names
+    from .seen_set import SeenSet
+except ImportError:
+    from main import name_cleaner_parallel, name_cleaner_stream  # When run directly or via pytest with pythonpath
+    from rules import RULE_NAMES, Rules, clean_names
+    from seen_set import SeenSet
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Normalize, validate and deduplicate a file of names, one per line")
+    parser.add_argument("input", help="Path to the input names file")
+    parser.add_argument(
+        "--out-dir",
+        help="Write clean.txt, invalid.txt and duplicates.txt here (default: clean names to stdout)",
+    )
+    parser.add_argument(
+        "--rule",
+        action="append",
+        default=[],
+        choices=RULE_NAMES,
+        help="Extra normalization rule; may be repeated",
+    )
+    parser.add_argument("--parallel", action="store_true", help="Use a process pool (requires --out-dir)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --parallel (default: CPU count)")
+    parser.add_argument(
+        "--max-in-memory",
+        type=int,
+        default=1_000_000,
+        help="Names kept in memory for dedup before spilling to disk (default: 1000000)",
+    )
+    args = parser.parse_args(argv)
+    rules = Rules.from_names(args.rule)
+
+    if args.out_dir is None:
+        if args.parallel:
+            parser.error("--parallel requires --out-dir")
+        counts = Counter()
+        with open(args.input, encoding="utf-8") as f, SeenSet(max_in_memory=args.max_in_memory) as seen:
+            for name in clean_names(f, rules, counts, seen=seen):
+                sys.stdout.write(name + "\n")
+    elif args.parallel:
+        counts = name_cleaner_parallel(
+            args.input, args.out_dir, workers=args.workers, max_in_memory=args.max_in_memory, rules=rules
+        )
+    else:
+        counts = name_cleaner_stream(args.input, args.out_dir, max_in_memory=args.max_in_memory, rules=rules)
+    print(
+        f"clean={counts['clean']} invalid={counts['invalid']} duplicates={counts['duplicates']}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,24 @@
+import io
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from typing import List
 
+try:
+    from .rules import Cleaner, Rules  # When run as module: python -m src.main
+    from .seen_set import SeenSet
+except ImportError:
+    from rules import Cleaner, Rules  # When run directly or via pytest with pythonpath
+    from seen_set import SeenSet
+
+CHUNK_SIZE = 1 << 20  # bytes of input read per batch in streaming mode
+SHARD_SIZE = 16 << 20  # target bytes per shard in parallel mode
+OUTPUTS = ("clean", "invalid", "duplicates")  # output categories; written to <name>.txt
+
 def name_cleaner(file_path: str):
 
 
@@ -23,7 +41,178 @@ def name_cleaner(file_path: str):
     print("The final list of names is", names)
     print("The invalid names were:", invalid)
     print("The duplicate names were:", duplicates)
-    
+
+
+def name_cleaner_stream(
+    file_path: str,
+    out_dir: str,
+    chunk_size: int = CHUNK_SIZE,
+    max_in_memory: int = 1_000_000,
+    rules: Rules | None = None,
+) -> dict[str, int]:
+    """
+    Streaming variant of name_cleaner for inputs that do not fit in memory.
+
+    Same rules as name_cleaner unless `rules` enables extra normalizations.
+    Clean, invalid and duplicate names are written as they are found to
+    clean.txt, invalid.txt and duplicates.txt in out_dir, and only the counts
+    are returned. Dedup memory is bounded by max_in_memory names; beyond that
+    the seen-set spills to disk.
+    """
+    cleaner = Cleaner(rules)
+    normalize, is_valid = cleaner.normalize, cleaner.is_valid
+    counts = dict.fromkeys(OUTPUTS, 0)
+    with ExitStack() as stack:
+        f = stack.enter_context(Path(file_path).open(encoding="utf-8", buffering=chunk_size))
+        outputs = _open_outputs(stack, out_dir, chunk_size)
+        seen = stack.enter_context(SeenSet(max_in_memory=max_in_memory))
+        while lines := f.readlines(chunk_size):
+            clean, invalid, duplicates = [], [], []
+            for line in lines:
+                name = normalize(line)
+                if not is_valid(name):
+                    invalid.append(name)
+                elif seen.add(name):
+                    clean.append(name)
+                else:
+                    duplicates.append(name)
+            _write_batch(outputs, counts, clean=clean, invalid=invalid, duplicates=duplicates)
+    return counts
+
+
+def name_cleaner_parallel(
+    file_path: str,
+    out_dir: str,
+    workers: int | None = None,
+    shard_size: int = SHARD_SIZE,
+    max_in_memory: int = 1_000_000,
+    rules: Rules | None = None,
+) -> dict[str, int]:
+    """
+    Multi-process variant of name_cleaner_stream with the same outputs and counts.
+
+    The file is split into byte-range shards on line boundaries; a process pool
+    normalizes, validates and locally dedups each shard into spill files. Shards
+    are merged in file order against one global seen-set, so clean.txt and
+    invalid.txt match the sequential output exactly. Within a shard,
+    duplicates.txt lists names first seen in earlier shards before repeats
+    inside the shard.
+
+    Memory stays bounded as in name_cleaner_stream: each worker holds one shard,
+    the parent reads spill files in CHUNK_SIZE batches, and at most workers + 1
+    shards are in flight.
+    """
+    shards = _shard_ranges(file_path, shard_size)
+    counts = dict.fromkeys(OUTPUTS, 0)
+    with ExitStack() as stack:
+        outputs = _open_outputs(stack, out_dir, CHUNK_SIZE)
+        spill_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix=".shards-", dir=out_dir))
+        seen = stack.enter_context(SeenSet(max_in_memory=max_in_memory))
+        workers = workers or os.cpu_count() or 1
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+        for spills, shard_counts in _shard_results(pool, file_path, shards, rules, spill_dir, window=workers + 1):
+            with open(spills["firsts"], encoding="utf-8", newline="\n", buffering=CHUNK_SIZE) as firsts:
+                while lines := firsts.readlines(CHUNK_SIZE):
+                    clean, cross = [], []
+                    for line in lines:
+                        name = line[:-1]
+                        (clean if seen.add(name) else cross).append(name)
+                    _write_batch(outputs, counts, clean=clean, duplicates=cross)
+            for key in ("duplicates", "invalid"):
+                with open(spills[key], encoding="utf-8", newline="\n") as f:
+                    shutil.copyfileobj(f, outputs[key], CHUNK_SIZE)
+                counts[key] += shard_counts[key]
+            for path in spills.values():
+                os.remove(path)
+    return counts
+
+
+def _shard_results(
+    pool: ProcessPoolExecutor,
+    file_path: str,
+    shards: list[tuple[int, int]],
+    rules: Rules | None,
+    spill_dir: str,
+    window: int,
+):
+    """Yield _clean_shard results in shard order, with at most `window` shards in flight."""
+    pending = deque()
+    for start, end in shards:
+        pending.append(pool.submit(_clean_shard, file_path, start, end, rules, spill_dir))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _open_outputs(stack: ExitStack, out_dir: str, buffering: int) -> dict:
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    return {
+        key: stack.enter_context((out / f"{key}.txt").open("w", encoding="utf-8", buffering=buffering))
+        for key in OUTPUTS
+    }
+
+
+def _write_batch(outputs: dict, counts: dict[str, int], **batches: list[str]) -> None:
+    for key, names in batches.items():
+        if names:
+            outputs[key].write("\n".join(names) + "\n")
+            counts[key] += len(names)
+
+
+def _shard_ranges(file_path: str, shard_size: int) -> list[tuple[int, int]]:
+    """Split the file into (start, end) byte ranges of about shard_size, each ending after a newline."""
+    size = os.path.getsize(file_path)
+    ranges = []
+    with open(file_path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + shard_size, size))
+            f.readline()  # advance to the end of the current line
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _clean_shard(
+    file_path: str, start: int, end: int, rules: Rules | None, spill_dir: str
+) -> tuple[dict[str, str], dict[str, int]]:
+    """
+    Worker: clean one byte range into spill files in spill_dir.
+
+    Returns the paths of the "firsts" (first occurrences in order),
+    "duplicates" (repeats within the shard) and "invalid" files, and the
+    duplicate and invalid counts.
+    """
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        # Universal newlines, as in text-mode reads, so a lone "\r" also ends a line
+        lines = io.StringIO(f.read(end - start).decode("utf-8"), newline=None)
+    cleaner = Cleaner(rules)
+    normalize, is_valid = cleaner.normalize, cleaner.is_valid
+    spills = {key: os.path.join(spill_dir, f"{start}.{key}") for key in ("firsts", "duplicates", "invalid")}
+    counts = {"duplicates": 0, "invalid": 0}
+    local: set[str] = set()
+    with ExitStack() as stack:
+        out = {
+            key: stack.enter_context(open(path, "w", encoding="utf-8", newline="\n", buffering=CHUNK_SIZE))
+            for key, path in spills.items()
+        }
+        for line in lines:
+            name = normalize(line)
+            if not is_valid(name):
+                key = "invalid"
+            elif name in local:
+                key = "duplicates"
+            else:
+                local.add(name)
+                out["firsts"].write(name + "\n")
+                continue
+            out[key].write(name + "\n")
+            counts[key] += 1
+    return spills, counts
 
 
 
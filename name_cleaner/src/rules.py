@@ -0,0 +1,140 @@
+"""
+Library API for name cleaning: pluggable normalization rules compiled once
+into a fast path (a translate table, C-level str methods and at most one regex),
+plus generators that classify or yield clean names while counting.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, fields
+
+try:
+    from .seen_set import SeenSet
+except ImportError:
+    from seen_set import SeenSet
+
+APOSTROPHES = "’‘ʼ´`"  # ’ ‘ ʼ ´ ` are normalized to '
+HYPHENS = "‐‑‒–—−"  # ‐ ‑ ‒ – — − are normalized to -
+
+
+@dataclass(frozen=True)
+class Rules:
+    """
+    Optional normalizations on top of the base rule (strip, lowercase, letters only).
+
+    nfkc: Unicode NFKC normalization (full-width and compatibility forms fold together).
+    casefold: Unicode casefold instead of lower() (e.g. "straße" == "STRASSE").
+    hyphens: allow single hyphens between letters; dash variants become "-".
+    apostrophes: allow single apostrophes between letters; quote variants become "'".
+    """
+
+    nfkc: bool = False
+    casefold: bool = False
+    hyphens: bool = False
+    apostrophes: bool = False
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "Rules":
+        """Build rules from names such as ["nfkc", "hyphens"]. Raises ValueError on unknown names."""
+        known = {f.name for f in fields(cls)}
+        names = list(names)
+        unknown = [n for n in names if n not in known]
+        if unknown:
+            raise ValueError(f"unknown rule(s): {', '.join(unknown)}; choose from {', '.join(sorted(known))}")
+        return cls(**dict.fromkeys(names, True))
+
+
+RULE_NAMES = tuple(f.name for f in fields(Rules))
+
+
+class Cleaner:
+    """Rules compiled into a `normalize(line) -> name` and an `is_valid(name) -> bool` function."""
+
+    __slots__ = ("rules", "normalize", "is_valid")
+
+    def __init__(self, rules: Rules | None = None):
+        self.rules = rules or Rules()
+        self.normalize = _compile_normalize(self.rules)
+        self.is_valid = _compile_is_valid(self.rules)
+
+    def __call__(self, line: str) -> str | None:
+        """Normalized name, or None if it is invalid."""
+        name = self.normalize(line)
+        return name if self.is_valid(name) else None
+
+
+def classify(lines: Iterable[str], cleaner: Cleaner | None = None, seen: SeenSet | None = None) -> Iterator[tuple[str, str]]:
+    """
+    Yield ("clean" | "invalid" | "duplicates", name) for each input line.
+
+    The first occurrence of a valid name is clean, later ones are duplicates.
+    Pass a SeenSet to bound dedup memory; by default one is created and closed here.
+    """
+    cleaner = cleaner or Cleaner()
+    normalize, is_valid = cleaner.normalize, cleaner.is_valid
+    own = seen is None
+    if own:
+        seen = SeenSet()
+    try:
+        for line in lines:
+            name = normalize(line)
+            if not is_valid(name):
+                yield "invalid", name
+            elif seen.add(name):
+                yield "clean", name
+            else:
+                yield "duplicates", name
+    finally:
+        if own:
+            seen.close()
+
+
+def clean_names(
+    lines: Iterable[str], rules: Rules | None = None, stats: Counter | None = None, seen: SeenSet | None = None
+) -> Iterator[str]:
+    """
+    Yield clean, deduplicated names in first-occurrence order; per-category counts go to stats.
+
+    Pass a SeenSet to bound dedup memory, as with classify.
+    """
+    stats = Counter() if stats is None else stats
+    for category, name in classify(lines, Cleaner(rules), seen):
+        stats[category] += 1
+        if category == "clean":
+            yield name
+
+
+def _translate_table(rules: Rules) -> dict[int, str]:
+    table = {}
+    if rules.apostrophes:
+        table.update(str.maketrans(dict.fromkeys(APOSTROPHES, "'")))
+    if rules.hyphens:
+        table.update(str.maketrans(dict.fromkeys(HYPHENS, "-")))
+    return table
+
+
+def _compile_normalize(rules: Rules) -> Callable[[str], str]:
+    # Pick one straight-line function per rule combination; no per-line branching on rules
+    fold = str.casefold if rules.casefold else str.lower
+    table = _translate_table(rules)
+    nfkc = unicodedata.normalize
+    if rules.nfkc and table:
+        return lambda line: fold(nfkc("NFKC", line.strip())).translate(table)
+    if rules.nfkc:
+        return lambda line: fold(nfkc("NFKC", line.strip()))
+    if table:
+        return lambda line: fold(line.strip()).translate(table)
+    return lambda line: fold(line.strip())
+
+
+def _compile_is_valid(rules: Rules) -> Callable[[str], bool]:
+    separators = ("-" if rules.hyphens else "") + ("'" if rules.apostrophes else "")
+    if not separators:
+        return str.isalpha
+    # Separators only between letters, never doubled or at the ends: every part must be
+    # non-empty and isalpha(), so letters mean the same as with no rules enabled.
+    # Most names have no separator, so try the whole-name isalpha() first.
+    split = re.compile(f"[{re.escape(separators)}]").split
+    return lambda name: name.isalpha() or all(part.isalpha() for part in split(name))
@@ -0,0 +1,106 @@
+"""Memory-bounded exact "have I seen this name?" set for streaming dedup."""
+
+import hashlib
+import math
+import sqlite3
+import tempfile
+from pathlib import Path
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings. False positives possible, false negatives not."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        # Standard sizing: m = -n ln p / (ln 2)^2 bits, k = m/n ln 2 hashes
+        bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._size = bits
+        self._hashes = max(1, round(bits / capacity * math.log(2)))
+        self._bits = bytearray((bits + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._size for i in range(self._hashes))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class SeenSet:
+    """
+    Exact set of names that keeps at most `max_in_memory` of them in RAM.
+
+    Once the in-memory set is full, further names spill to a temporary SQLite
+    file. A Bloom filter sized for `expected` spilled names sits in front of the
+    disk, so most first-time names are confirmed new without a disk lookup;
+    Bloom hits are verified against SQLite, keeping answers exact.
+    """
+
+    def __init__(self, max_in_memory: int = 1_000_000, expected: int = 10_000_000, batch: int = 10_000):
+        self._memory: set[str] = set()
+        self._max_in_memory = max_in_memory
+        self._expected = expected
+        self._batch = batch
+        self._pending: set[str] = set()
+        self._bloom: BloomFilter | None = None
+        self._db: sqlite3.Connection | None = None
+        self._tmpdir: tempfile.TemporaryDirectory | None = None
+
+    def add(self, name: str) -> bool:
+        """Record name. Returns True if it was not seen before."""
+        if name in self._memory:
+            return False
+        if len(self._memory) < self._max_in_memory:
+            self._memory.add(name)
+            return True
+        return self._add_spilled(name)
+
+    def close(self) -> None:
+        """Release the spill file, if any."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    def __enter__(self) -> "SeenSet":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def spilled(self) -> bool:
+        return self._db is not None
+
+    def _add_spilled(self, name: str) -> bool:
+        if self._db is None:
+            self._tmpdir = tempfile.TemporaryDirectory(prefix="name_cleaner_")
+            self._db = sqlite3.connect(Path(self._tmpdir.name) / "seen.db")
+            self._db.execute("PRAGMA journal_mode=OFF")
+            self._db.execute("PRAGMA synchronous=OFF")
+            self._db.execute("CREATE TABLE seen (name TEXT PRIMARY KEY) WITHOUT ROWID")
+            self._bloom = BloomFilter(self._expected)
+        if name in self._pending:
+            return False
+        if name in self._bloom:
+            row = self._db.execute("SELECT 1 FROM seen WHERE name = ?", (name,)).fetchone()
+            if row is not None:
+                return False
+        self._bloom.add(name)
+        self._pending.add(name)
+        if len(self._pending) >= self._batch:
+            self._flush()
+        return True
+
+    def _flush(self) -> None:
+        self._db.executemany("INSERT INTO seen VALUES (?)", ((n,) for n in self._pending))
+        self._db.commit()
+        self._pending.clear()
+
@@ -0,0 +1,81 @@
+from collections import Counter
+
+import pytest
+
+from cli import main as cli_main
+from rules import Cleaner, Rules, classify, clean_names
+from seen_set import SeenSet
+
+
+def test_default_rules_match_name_cleaner():
+    clean = Cleaner()
+    assert clean("  Alice ") == "alice"
+    assert clean("mary-jane") is None
+    assert clean("123") is None
+    assert clean("") is None
+
+
+def test_casefold_and_nfkc():
+    assert Cleaner(Rules(casefold=True))("STRASSE") == Cleaner(Rules(casefold=True))("straße")
+    assert Cleaner(Rules(nfkc=True))("ＡＢＣ") == "abc"
+    assert Cleaner()("ＡＢＣ") == "ａｂｃ"
+
+
+def test_hyphens_and_apostrophes():
+    clean = Cleaner(Rules(hyphens=True, apostrophes=True))
+    assert clean("Mary–Jane") == "mary-jane"
+    assert clean("O’Brien") == "o'brien"
+    assert clean("-bob") is None
+    assert clean("a--b") is None
+    assert Cleaner(Rules(hyphens=True))("o'brien") is None
+
+
+@pytest.mark.parametrize("rules", [Rules(), Rules(hyphens=True), Rules(apostrophes=True), Rules(hyphens=True, apostrophes=True)])
+@pytest.mark.parametrize("name", ["a²", "x½y", "Ⅳ", "ann-²", "o'½", "a_b", "a1"])
+def test_separator_rules_do_not_widen_letters(rules, name):
+    assert Cleaner(rules)(name) is None
+
+
+def test_rules_from_names():
+    assert Rules.from_names(["nfkc", "hyphens"]) == Rules(nfkc=True, hyphens=True)
+    with pytest.raises(ValueError):
+        Rules.from_names(["bogus"])
+
+
+def test_classify_and_clean_names():
+    lines = ["Alice\n", "bob\n", "ALICE\n", "42\n"]
+    assert list(classify(lines)) == [("clean", "alice"), ("clean", "bob"), ("duplicates", "alice"), ("invalid", "42")]
+    stats = Counter()
+    assert list(clean_names(lines, stats=stats)) == ["alice", "bob"]
+    assert stats == {"clean": 2, "duplicates": 1, "invalid": 1}
+
+
+def test_clean_names_uses_given_seen_set():
+    lines = [f"n{'a' * i}\n" for i in range(10)] * 2
+    with SeenSet(max_in_memory=3) as seen:
+        assert list(clean_names(lines, seen=seen)) == [f"n{'a' * i}" for i in range(10)]
+        assert seen.spilled
+        assert not seen.add("na")
+
+
+def test_cli_stdout_honours_max_in_memory(tmp_path, capsys, monkeypatch):
+    import cli
+    created = []
+    monkeypatch.setattr(cli, "SeenSet", lambda **kw: created.append(kw) or SeenSet(**kw))
+    src = tmp_path / "names.txt"
+    src.write_text("bob\nann\nBOB\n", encoding="utf-8")
+    cli_main([str(src), "--max-in-memory", "1"])
+    assert capsys.readouterr().out.splitlines() == ["bob", "ann"]
+    assert created == [{"max_in_memory": 1}]
+
+
+def test_cli_stdout_and_out_dir(tmp_path, capsys):
+    src = tmp_path / "names.txt"
+    src.write_text("O’Brien\no'brien\nbob\n1\n", encoding="utf-8")
+    cli_main([str(src), "--rule", "apostrophes"])
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == ["o'brien", "bob"]
+    assert "clean=2 invalid=1 duplicates=1" in captured.err
+
+    cli_main([str(src), "--out-dir", str(tmp_path / "out")])
+    assert (tmp_path / "out" / "clean.txt").read_text(encoding="utf-8").splitlines() == ["bob"]
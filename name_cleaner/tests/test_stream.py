@@ -0,0 +1,64 @@
+import pytest
+
+from main import _shard_ranges, name_cleaner_parallel, name_cleaner_stream
+from seen_set import SeenSet
+
+
+def _lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_stream_writes_outputs_and_counts(tmp_path):
+    src = tmp_path / "names.txt"
+    src.write_text("alice\n  Bob\nALICE\n123\ncarol\n@x\nbob\n", encoding="utf-8")
+    counts = name_cleaner_stream(str(src), str(tmp_path / "out"))
+    assert counts == {"clean": 3, "invalid": 2, "duplicates": 2}
+    assert _lines(tmp_path / "out" / "clean.txt") == ["alice", "bob", "carol"]
+    assert _lines(tmp_path / "out" / "invalid.txt") == ["123", "@x"]
+    assert _lines(tmp_path / "out" / "duplicates.txt") == ["alice", "bob"]
+
+
+def test_stream_small_chunks_and_spilled_seen_set(tmp_path):
+    src = tmp_path / "names.txt"
+    names = [f"n{'a' * (i % 7)}b{'c' * (i % 11)}" for i in range(200)]
+    src.write_text("\n".join(names) + "\n", encoding="utf-8")
+    counts = name_cleaner_stream(str(src), str(tmp_path / "out"), chunk_size=16, max_in_memory=5)
+    unique = list(dict.fromkeys(names))
+    assert counts == {"clean": len(unique), "invalid": 0, "duplicates": len(names) - len(unique)}
+    assert _lines(tmp_path / "out" / "clean.txt") == unique
+
+
+def test_seen_set_exact_after_spill():
+    with SeenSet(max_in_memory=2, expected=100, batch=3) as seen:
+        assert [seen.add(n) for n in "abcdefab"] == [True] * 6 + [False, False]
+        assert seen.spilled
+        assert [seen.add(n) for n in "cdefg"] == [False] * 4 + [True]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "\n".join(f"  {'Ab' * (i % 13)}x{'c' * (i % 5)}" if i % 9 else "bad1" for i in range(500)).encode(),  # no trailing newline
+        b"alice\rbob\ncarol\n",  # lone "\r" ends a line in text mode
+        b"alice\r\nbob\r\nALICE\r\n12\r\n",
+    ],
+)
+def test_parallel_matches_sequential(tmp_path, data):
+    src = tmp_path / "names.txt"
+    src.write_bytes(data)
+    seq = name_cleaner_stream(str(src), str(tmp_path / "seq"))
+    par = name_cleaner_parallel(str(src), str(tmp_path / "par"), workers=2, shard_size=200)
+    assert par == seq
+    for key in ("clean", "invalid"):
+        assert _lines(tmp_path / "par" / f"{key}.txt") == _lines(tmp_path / "seq" / f"{key}.txt")
+    assert sorted(_lines(tmp_path / "par" / "duplicates.txt")) == sorted(_lines(tmp_path / "seq" / "duplicates.txt"))
+
+
+def test_shard_ranges_align_on_lines(tmp_path):
+    src = tmp_path / "names.txt"
+    src.write_bytes(b"aaa\nbb\ncccc\nd\n")
+    ranges = _shard_ranges(str(src), 5)
+    assert ranges[0][0] == 0 and ranges[-1][1] == src.stat().st_size
+    data = src.read_bytes()
+    for start, end in ranges:
+        assert data[start:end].endswith(b"\n")
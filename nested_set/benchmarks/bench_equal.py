@@ -0,0 +1,79 @@
+"""Time nested_sets_equal (canonical labels) against the pairwise reference on wide, deep and batch inputs.
+
+    python benchmarks/bench_equal.py --width 50000 --nested-width 300 --depth 4
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from set_compare import nested_sets_equal, nested_sets_equal_many, nested_sets_equal_pairwise  # noqa: E402
+
+
+def random_nested(rng: random.Random, width: int, depth: int, fanout: int = 3) -> frozenset:
+    """Random nested frozenset: `width` strings plus `fanout` nested children per level, `depth` levels deep."""
+    items = {f"s{rng.randrange(width * 10)}" for _ in range(width)}
+    if depth > 0:
+        items.update(random_nested(rng, width, depth - 1, fanout) for _ in range(fanout))
+    return frozenset(items)
+
+
+def rebuild(s: frozenset) -> frozenset:
+    """Structurally equal copy with no shared sub-objects, so comparisons cannot short-circuit on identity."""
+    return frozenset(rebuild(x) if isinstance(x, frozenset) else "".join(x) for x in s)
+
+
+def chain(depth: int) -> frozenset:
+    """Deep, narrow input: {"x", {"x", {...}}} nested `depth` levels."""
+    s = frozenset({"leaf"})
+    for i in range(depth):
+        s = frozenset({f"x{i}", s})
+    return s
+
+
+def _time(fn, *args) -> str:
+    start = time.perf_counter()
+    try:
+        result = fn(*args)
+    except RecursionError:
+        return "RecursionError"
+    assert result is True or all(result)
+    return f"{time.perf_counter() - start:9.4f}s"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=20_000, help="Width of the flat input")
+    parser.add_argument("--nested-width", type=int, default=300, help="Strings per level of the random nested input")
+    parser.add_argument("--depth", type=int, default=4, help="Depth of the random nested input")
+    parser.add_argument("--chain", type=int, default=5000, help="Depth of the narrow chain input")
+    parser.add_argument("--batch", type=int, default=200, help="Candidates compared against one reference")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    flat = random_nested(rng, args.width, 0)
+    nested = random_nested(rng, args.nested_width, args.depth)
+    # Each pair is structurally equal but shares no sub-objects
+    cases = {
+        f"flat (width={args.width})": (flat, rebuild(flat)),
+        f"nested (width={args.nested_width}, depth={args.depth})": (nested, rebuild(nested)),
+        f"deep chain (depth={args.chain})": (chain(args.chain), chain(args.chain)),
+    }
+    for label, (a, b) in cases.items():
+        for name, fn in (("canonical", nested_sets_equal), ("pairwise", nested_sets_equal_pairwise)):
+            print(f"{label:<36} {name:<10} {_time(fn, a, b)}")
+
+    # Candidates share most sub-sets with each other, as in versioned snapshots of one structure
+    shared = list(nested - {x for x in nested if isinstance(x, str)})
+    candidates = [frozenset(rebuild(nested - frozenset(shared)) | frozenset(shared)) for _ in range(args.batch)]
+    label = f"batch (1 vs {args.batch}, shared sub-sets)"
+    print(f"{label:<36} {'many':<10} {_time(nested_sets_equal_many, nested, candidates)}")
+    print(f"{label:<36} {'one-by-one':<10} {_time(lambda: [nested_sets_equal(nested, c) for c in candidates])}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Time signature-indexed deduplication against naive pairwise deduplication of many nested sets.
+
+    python benchmarks/bench_index.py --items 200000 --distinct 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from set_compare import nested_sets_equal  # noqa: E402
+from set_index import dedupe_nested_sets  # noqa: E402
+
+
+def random_small(rng: random.Random, depth: int = 2) -> frozenset:
+    items = {f"t{rng.randrange(50)}" for _ in range(rng.randint(1, 4))}
+    if depth:
+        items.update(random_small(rng, depth - 1) for _ in range(rng.randint(0, 2)))
+    return frozenset(items)
+
+
+def copy(s: frozenset) -> frozenset:
+    """Equal copy sharing no sub-objects."""
+    return frozenset(copy(x) if isinstance(x, frozenset) else "".join(x) for x in s)
+
+
+def naive_dedupe(items):
+    unique = []
+    for s in items:
+        if not any(nested_sets_equal(u, s) for u in unique):
+            unique.append(s)
+    return unique
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=10_000)
+    parser.add_argument("--naive-items", type=int, default=2_000, help="Prefix size for the quadratic baseline")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    pool = [random_small(rng) for _ in range(args.distinct)]
+    items = [copy(rng.choice(pool)) for _ in range(args.items)]
+
+    start = time.perf_counter()
+    unique = dedupe_nested_sets(items)
+    elapsed = time.perf_counter() - start
+    print(f"indexed  {args.items:>9} items  {len(unique):>7} classes  {elapsed:9.3f}s")
+
+    prefix = items[: args.naive_items]
+    start = time.perf_counter()
+    naive = naive_dedupe(prefix)
+    elapsed = time.perf_counter() - start
+    assert len(naive) == len(dedupe_nested_sets(prefix))
+    print(f"pairwise {len(prefix):>9} items  {len(naive):>7} classes  {elapsed:9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ Note: In Python, nested sets must use frozenset (sets are unhashable).
       e.g. {"a", frozenset({"b"})} not {"a", {"b"}}
 """
 
+import hashlib
+
 
 def nested_sets_equal(a: set | frozenset, b: set | frozenset) -> bool:
     """
@@ -13,6 +15,135 @@ def nested_sets_equal(a: set | frozenset, b: set | frozenset) -> bool:
 
     Elements may be strings or recursively nested frozensets.
     Does not use built-in set equality.
+
+    Both sides are reduced to a canonical integer label (AHU-style relabeling)
+    sharing one label table, so equal structures get equal labels. Cost is
+    O(N log w) for N total elements and width w, instead of the quadratic
+    pairwise matching in nested_sets_equal_pairwise. Labeling uses an explicit
+    stack, so nesting depth is not limited by the recursion limit.
+    """
+    if a is b:
+        return True
+    if len(a) != len(b):
+        return False
+    canon = Canonicalizer()
+    return canon.label(a) == canon.label(b)
+
+
+def nested_sets_equal_many(reference: set | frozenset, candidates) -> list[bool]:
+    """
+    nested_sets_equal(reference, c) for each candidate c.
+
+    The reference is labeled once, and sub-sets shared between candidates
+    (the same frozenset object) are labeled only once across the batch.
+    """
+    canon = Canonicalizer()
+    ref = canon.label(reference)
+    return [c is reference or (len(c) == len(reference) and canon.label(c) == ref) for c in candidates]
+
+
+def canonical_label(s: set | frozenset, table: dict) -> int:
+    """
+    Integer label for s, unique per structure within one table.
+
+    A set's canonical key is its sorted strings plus the sorted labels of its
+    nested sets. Labels are only comparable when built with the same table.
+    """
+    return Canonicalizer(table).label(s)
+
+
+class Canonicalizer:
+    """
+    Canonical labels sharing one table, with a per-object label cache.
+
+    Each frozenset object is labeled at most once per Canonicalizer, however
+    many times it appears, so shared sub-structures are not re-walked. The
+    cache keys on id() and holds a reference to the object so ids cannot be
+    reused while cached. Mutable top-level sets are never cached.
+    """
+
+    def __init__(self, table: dict | None = None):
+        self.table = {} if table is None else table
+        self._labels: dict[int, tuple[frozenset, int]] = {}
+
+    def label(self, root: set | frozenset) -> int:
+        """Canonical label for root, computed bottom-up with an explicit stack."""
+        table = self.table
+        return _fold(
+            root,
+            self._labels,
+            lambda strings, child_labels: table.setdefault((tuple(strings), tuple(child_labels)), len(table)),
+        )
+
+
+def structural_signature(s: set | frozenset) -> bytes:
+    """
+    128-bit digest of s's structure, stable across processes and runs.
+
+    Equal nested sets (per nested_sets_equal) always have equal signatures;
+    unequal ones collide only with negligible probability, so callers that
+    need certainty should confirm matches with nested_sets_equal.
+    """
+    return _fold(s, {}, _digest)
+
+
+def _digest(strings: list[str], child_digests: list[bytes]) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(len(strings).to_bytes(8, "little"))
+    for x in strings:
+        data = x.encode("utf-8", "surrogatepass")
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    h.update(b"".join(child_digests))
+    return h.digest()
+
+
+def _fold(root: set | frozenset, cache: dict, combine):
+    """
+    Bottom-up value for root: combine(sorted strings, sorted child values) at every set.
+
+    Uses an explicit stack, so depth is not limited by the recursion limit.
+    Values of frozensets are cached by id() in `cache` as (node, value),
+    keeping the node alive so its id cannot be reused; a mutable top-level
+    set is never cached.
+    """
+    hit = cache.get(id(root))
+    if hit is not None and hit[0] is root:
+        return hit[1]
+    # Entries are (node, None) before its children are split out, then
+    # (node, (strings, child_sets)) once they are queued ahead of it
+    stack: list = [(root, None)]
+    while stack:
+        node, parts = stack.pop()
+        if parts is None:
+            hit = cache.get(id(node))
+            if hit is not None and hit[0] is node:
+                continue
+            strings, children = [], []
+            for x in node:
+                if isinstance(x, str):
+                    strings.append(x)
+                elif isinstance(x, frozenset):
+                    children.append(x)
+                else:
+                    raise TypeError(f"nested set elements must be str or frozenset, not {type(x).__name__}")
+            stack.append((node, (strings, children)))
+            stack.extend((c, None) for c in children)
+            continue
+        strings, children = parts
+        strings.sort()
+        value = combine(strings, sorted([cache[id(c)][1] for c in children]))
+        if node is root and not isinstance(root, frozenset):
+            return value
+        cache[id(node)] = (node, value)
+    return cache[id(root)][1]
+
+
+def nested_sets_equal_pairwise(a: set | frozenset, b: set | frozenset) -> bool:
+    """
+    Reference implementation of nested_sets_equal: greedy pairwise matching.
+
+    Quadratic in set width at every level; kept for testing and benchmarks.
     """
     a, b = set(a), set(b)
     if len(a) != len(b):
@@ -33,4 +164,4 @@ def _elem_equal(x, y) -> bool:
         return False
     if isinstance(x, str):
         return x == y
-    return nested_sets_equal(x, y)
+    return nested_sets_equal_pairwise(x, y)
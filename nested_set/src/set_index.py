@@ -0,0 +1,68 @@
+"""
+Index of nested sets by structural signature, for near-linear deduplication,
+membership lookup and grouping into equivalence classes.
+
+Buckets are keyed by structural_signature; any match inside a bucket is
+confirmed with nested_sets_equal, so results are exact even on a collision.
+"""
+
+from collections.abc import Iterable
+
+from set_compare import nested_sets_equal, structural_signature
+
+
+class NestedSetIndex:
+    """One representative per equivalence class (the first one added), bucketed by signature."""
+
+    def __init__(self, items: Iterable[set | frozenset] = ()):
+        self._buckets: dict[bytes, list[set | frozenset]] = {}
+        self._size = 0
+        for s in items:
+            self.add(s)
+
+    def __len__(self) -> int:
+        """Number of distinct equivalence classes."""
+        return self._size
+
+    def __contains__(self, s: set | frozenset) -> bool:
+        return self.find(s) is not None
+
+    def __iter__(self):
+        for bucket in self._buckets.values():
+            yield from bucket
+
+    def find(self, s: set | frozenset) -> set | frozenset | None:
+        """Stored representative equal to s, or None."""
+        return self._match(structural_signature(s), s)
+
+    def add(self, s: set | frozenset) -> tuple[set | frozenset, bool]:
+        """Add s. Returns (its class representative, True if s started a new class)."""
+        signature = structural_signature(s)
+        existing = self._match(signature, s)
+        if existing is not None:
+            return existing, False
+        self._buckets.setdefault(signature, []).append(s)
+        self._size += 1
+        return s, True
+
+    def _match(self, signature: bytes, s: set | frozenset) -> set | frozenset | None:
+        for candidate in self._buckets.get(signature, ()):
+            if nested_sets_equal(candidate, s):
+                return candidate
+        return None
+
+
+def dedupe_nested_sets(items: Iterable[set | frozenset]) -> list[set | frozenset]:
+    """First occurrence of each distinct nested set, in input order."""
+    index = NestedSetIndex()
+    return [s for s in items if index.add(s)[1]]
+
+
+def group_nested_sets(items: Iterable[set | frozenset]) -> list[list[set | frozenset]]:
+    """Partition items into equivalence classes, classes and members in first-occurrence order."""
+    index = NestedSetIndex()
+    groups: dict[int, list[set | frozenset]] = {}
+    for s in items:
+        rep, _ = index.add(s)
+        groups.setdefault(id(rep), []).append(s)
+    return list(groups.values())
@@ -1,8 +1,16 @@
 """Tests for nested set equality."""
 
+import random
+
 import pytest
 
-from set_compare import nested_sets_equal  # pyright: ignore[reportMissingImports]
+from set_compare import (  # pyright: ignore[reportMissingImports]
+    Canonicalizer,
+    canonical_label,
+    nested_sets_equal,
+    nested_sets_equal_many,
+    nested_sets_equal_pairwise,
+)
 
 
 def test_empty_sets_equal():
@@ -41,3 +49,81 @@ def test_deeply_nested_equal():
     inner = frozenset({"x"})
     outer = frozenset({"a", inner})
     assert nested_sets_equal({outer}, {outer}) is True
+
+
+def test_string_and_set_not_confused():
+    assert nested_sets_equal({"a"}, {frozenset({"a"})}) is False
+    assert nested_sets_equal({frozenset()}, {""}) is False
+
+
+def test_nesting_depth_matters():
+    assert nested_sets_equal({frozenset({frozenset({"a"})})}, {frozenset({"a"})}) is False
+
+
+def test_non_string_element_raises():
+    with pytest.raises(TypeError):
+        nested_sets_equal({1}, {1})
+
+
+def test_canonical_label_shared_table():
+    table = {}
+    x = canonical_label(frozenset({"a", frozenset({"b"})}), table)
+    y = canonical_label({frozenset({"b"}), "a"}, table)
+    z = canonical_label(frozenset({"a", frozenset({"c"})}), table)
+    assert x == y
+    assert x != z
+
+
+def _random_nested(rng, depth):
+    items = {rng.choice("abcd") for _ in range(rng.randint(0, 3))}
+    if depth:
+        items.update(_random_nested(rng, depth - 1) for _ in range(rng.randint(0, 2)))
+    return frozenset(items)
+
+
+def test_matches_pairwise_reference_on_random_inputs():
+    rng = random.Random(0)
+    for _ in range(500):
+        a, b = _random_nested(rng, 3), _random_nested(rng, 3)
+        assert nested_sets_equal(a, b) is nested_sets_equal_pairwise(a, b)
+        assert nested_sets_equal(a, a) is True
+
+
+def _chain(depth, leaf="leaf"):
+    s = frozenset({leaf})
+    for _ in range(depth):
+        s = frozenset({"x", s})
+    return s
+
+
+def test_deep_nesting_beyond_recursion_limit():
+    assert nested_sets_equal({_chain(20_000)}, {_chain(20_000)}) is True
+    assert nested_sets_equal({_chain(20_000)}, {_chain(20_000, leaf="other")}) is False
+
+
+def test_shared_subsets_labeled_once():
+    inner = frozenset({"a", frozenset({"b"})})
+    canon = Canonicalizer()
+    canon.label(frozenset({"x", inner}))
+    size = len(canon.table)
+    canon.label(frozenset({"y", inner}))
+    assert len(canon.table) == size + 1
+
+
+def test_mutable_top_level_set_not_cached():
+    canon = Canonicalizer()
+    s = {"a"}
+    first = canon.label(s)
+    s.add("b")
+    assert canon.label(s) != first
+
+
+def test_nested_sets_equal_many():
+    ref = {"a", frozenset({"b", "c"})}
+    candidates = [
+        {"a", frozenset({"c", "b"})},
+        {"a", frozenset({"b"})},
+        {"a"},
+        frozenset({frozenset({"b", "c"}), "a"}),
+    ]
+    assert nested_sets_equal_many(ref, candidates) == [True, False, False, True]
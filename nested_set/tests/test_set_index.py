@@ -0,0 +1,58 @@
+"""Tests for structural signatures and the nested set index."""
+
+import random
+
+from set_compare import nested_sets_equal, structural_signature  # pyright: ignore[reportMissingImports]
+from set_index import NestedSetIndex, dedupe_nested_sets, group_nested_sets  # pyright: ignore[reportMissingImports]
+
+
+def test_signature_consistent_with_equality():
+    a = {"a", frozenset({"b", frozenset({"c"})})}
+    b = frozenset({frozenset({frozenset({"c"}), "b"}), "a"})
+    assert structural_signature(a) == structural_signature(b)
+    assert structural_signature({"a"}) != structural_signature({frozenset({"a"})})
+    assert structural_signature({"ab"}) != structural_signature({"a", "b"})
+
+
+def test_signature_matches_equality_on_random_inputs():
+    rng = random.Random(1)
+
+    def make(depth):
+        items = {rng.choice("abc") for _ in range(rng.randint(0, 2))}
+        if depth:
+            items.update(make(depth - 1) for _ in range(rng.randint(0, 2)))
+        return frozenset(items)
+
+    for _ in range(300):
+        a, b = make(3), make(3)
+        assert (structural_signature(a) == structural_signature(b)) is nested_sets_equal(a, b)
+
+
+def test_index_membership_and_representative():
+    first = frozenset({"a", frozenset({"b"})})
+    index = NestedSetIndex([first, {"c"}])
+    assert len(index) == 2
+    assert {frozenset({"b"}), "a"} in index
+    assert {"d"} not in index
+    rep, new = index.add(frozenset({frozenset({"b"}), "a"}))
+    assert rep is first
+    assert new is False
+    assert len(index) == 2
+
+
+def test_index_verifies_colliding_bucket(monkeypatch):
+    import set_index
+
+    monkeypatch.setattr(set_index, "structural_signature", lambda s: b"same")
+    index = NestedSetIndex([{"a"}, {"b"}])
+    assert len(index) == 2
+    assert {"b"} in index
+    assert {"c"} not in index
+
+
+def test_dedupe_and_group():
+    items = [{"a"}, frozenset({"b"}), {"a"}, frozenset({frozenset({"a"})}), frozenset({"b"})]
+    assert dedupe_nested_sets(items) == [{"a"}, frozenset({"b"}), frozenset({frozenset({"a"})})]
+    groups = group_nested_sets(items)
+    assert [len(g) for g in groups] == [2, 2, 1]
+    assert groups[1][0] is items[1] and groups[1][1] is items[4]
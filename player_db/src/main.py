@@ -1,7 +1,8 @@
 import logging
+import threading
 import time
 
-from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
@@ -31,10 +32,14 @@ class UpdatePlayer(BaseModel):
 
 
 # --- Store ---
-# _next_id: auto-increment for new player ids
-# _player_cache: cache for GET /players/{id} (invalidated on PATCH)
+# _next_id: auto-increment for new player ids (only read/advanced under _write_lock)
+# _player_cache: (record, version) snapshots for GET /players/{id} (invalidated on PATCH)
+# _player_versions: per-player version used for ETag / If-Match (missing = 1)
+# _write_lock: serializes writers; records are copy-on-write so readers never lock
 _next_id = 4
-_player_cache: dict[int, dict] = {}
+_player_cache: dict[int, tuple[dict, int]] = {}
+_player_versions: dict[int, int] = {}
+_write_lock = threading.Lock()
 
 MANAGERS: list[dict] = [
     {"id": 1, "name": "Mike Smith"},
@@ -88,6 +93,35 @@ def _player_with_relations(player: dict) -> dict:
     return out
 
 
+def _find_index(items: list[dict], id: int) -> int | None:
+    """Position of the item with the given id, or None if not found."""
+    return next((i for i, x in enumerate(items) if x.get("id") == id), None)
+
+
+def _format_etag(version: int) -> str:
+    """Quoted ETag for a player version."""
+    return f'"{version}"'
+
+
+def _etag(id: int) -> str:
+    """Quoted ETag for the player's current version."""
+    return _format_etag(_player_versions.get(id, 1))
+
+
+def _etag_matches(if_match: str, id: int) -> bool:
+    """True if the If-Match header lists the player's current ETag (or is '*'); weak tags never match."""
+    tags = [t.strip() for t in if_match.split(",")]
+    return "*" in tags or _etag(id) in tags
+
+
+def _allocate_id() -> int:
+    """Reserve the next player id. Caller must hold _write_lock."""
+    global _next_id
+    id = _next_id
+    _next_id += 1
+    return id
+
+
 def _get_player_by_id(id: int) -> dict | None:
     """Simulated slow lookup. Do not remove the delay."""
     time.sleep(2)
@@ -129,13 +163,25 @@ def get_players(  # List players; optional sort, pagination; admin sees full obj
 
 
 @app.get("/v1/players/{id}")
-def get_player_by_id(id: int):  # Get single player by id (cached); includes manager and team when set
-    if id in _player_cache:
-        return _player_with_relations(_player_cache[id])
+def get_player_by_id(id: int, response: Response):  # Get single player by id (cached); includes manager and team when set
+    # The record and its version are read as one snapshot so the ETag always matches the body
+    cached = _player_cache.get(id)
+    if cached is not None:
+        player, version = cached
+        response.headers["ETag"] = _format_etag(version)
+        return _player_with_relations(player)
     player = _get_player_by_id(id)
     if not player:
         raise HTTPException(404, "Not found")
-    _player_cache[id] = player
+    with _write_lock:
+        current = find_player(PLAYERS, id)
+        if current is None:
+            raise HTTPException(404, "Not found")
+        # A PATCH may have replaced the record during the slow lookup; serve the current one
+        version = _player_versions.get(id, 1)
+        player = current
+        _player_cache[id] = (player, version)
+    response.headers["ETag"] = _format_etag(version)
     return _player_with_relations(player)
 
 
@@ -167,22 +213,35 @@ def get_player_pitching(id: int):  # Get pitching stats for a player
 
 
 @app.post("/v1/players", status_code=201)
-def post_player(body: Player):
-    global _next_id
-    player = {"id": _next_id, **body.model_dump(exclude={"id"})}
-    _next_id += 1
-    PLAYERS.append(player)
+def post_player(body: Player, response: Response):
+    fields = body.model_dump(exclude={"id"})
+    with _write_lock:
+        player = {"id": _allocate_id(), **fields}
+        _player_versions[player["id"]] = 1
+        PLAYERS.append(player)
+    response.headers["ETag"] = _format_etag(1)
     return player
 
 
 @app.patch("/v1/players/{id}")
-def patch_player(id: int, body: UpdatePlayer):  # Partial update; invalidates cache for this player
-    player = find_player(PLAYERS, id)
-    if not player:
-        raise HTTPException(404, "Not found")
-    for k, v in body.model_dump(exclude_unset=True).items():
-        if v is not None:
-            player[k] = v
-    if id in _player_cache:
-        del _player_cache[id]
+def patch_player(  # Partial update; optional If-Match version check; invalidates cache for this player
+    id: int,
+    body: UpdatePlayer,
+    response: Response,
+    if_match: str | None = Header(None),
+):
+    changes = {k: v for k, v in body.model_dump(exclude_unset=True).items() if v is not None}
+    with _write_lock:
+        index = _find_index(PLAYERS, id)
+        if index is None:
+            raise HTTPException(404, "Not found")
+        if if_match is not None and not _etag_matches(if_match, id):
+            logger.warning("Stale If-Match for player %s: %s", id, if_match)
+            raise HTTPException(412, "Player was modified; refetch and retry")
+        # Copy-on-write: readers holding the old dict never see a partial update
+        player = {**PLAYERS[index], **changes}
+        PLAYERS[index] = player
+        _player_versions[id] = _player_versions.get(id, 1) + 1
+        _player_cache.pop(id, None)
+        response.headers["ETag"] = _etag(id)
     return player
@@ -1,7 +1,9 @@
 # TestClient needs httpx: pip install httpx
 import logging
+import threading
 
 import pytest
+from fastapi import Response
 from fastapi.testclient import TestClient
 
 from main import app  # pyright: ignore[reportMissingImports]
@@ -28,6 +30,7 @@ def reset_store(monkeypatch):
     monkeypatch.setattr(main, "PITCHING_STATS", [])
     monkeypatch.setattr(main, "_next_id", 4)
     monkeypatch.setattr(main, "_player_cache", {})
+    monkeypatch.setattr(main, "_player_versions", {})
 
 def test_post_player_creates_and_returns_player():
     r = client.post(
@@ -163,3 +166,128 @@ def test_unexpected_error_logs_exception(caplog, monkeypatch):
         r = no_raise_client.get("/v1/players", params={"isAdmin": "false"})
     assert r.status_code == 500
     assert any("Unhandled" in rec.message for rec in caplog.records)
+
+
+def test_get_player_by_id_returns_etag(monkeypatch):
+    monkeypatch.setattr("main.time.sleep", lambda s: None)
+    r = client.get("/v1/players/1")
+    assert r.headers["ETag"] == '"1"'
+    client.patch("/v1/players/1", json={"weight": 70})
+    r2 = client.get("/v1/players/1")
+    assert r2.headers["ETag"] == '"2"'
+
+
+def test_patch_with_matching_if_match_succeeds():
+    r = client.patch("/v1/players/1", json={"weight": 70}, headers={"If-Match": '"1"'})
+    assert r.status_code == 200
+    assert r.headers["ETag"] == '"2"'
+    assert r.json()["weight"] == 70
+
+
+def test_patch_with_stale_if_match_returns_412():
+    client.patch("/v1/players/1", json={"weight": 70})
+    r = client.patch("/v1/players/1", json={"weight": 90}, headers={"If-Match": '"1"'})
+    assert r.status_code == 412
+    r2 = client.get("/v1/players", params={"isAdmin": "true"})
+    assert r2.json()["players"][0]["weight"] == 70
+
+
+def test_patch_with_weak_if_match_returns_412():
+    r = client.patch("/v1/players/1", json={"weight": 70}, headers={"If-Match": 'W/"1"'})
+    assert r.status_code == 412
+    assert client.get("/v1/players", params={"isAdmin": "true"}).json()["players"][0]["weight"] == 65
+
+
+def test_post_etag_matches_created_version():
+    r = client.post("/v1/players", json={"firstName": "Dave", "lastName": "Davis", "weight": 75, "height": 180})
+    assert r.headers["ETag"] == '"1"'
+
+
+def test_patch_does_not_mutate_previous_record():
+    import main
+    before = main.find_player(main.PLAYERS, 1)
+    client.patch("/v1/players/1", json={"firstName": "Alicia"})
+    assert before["firstName"] == "Alice"
+    assert main.find_player(main.PLAYERS, 1)["firstName"] == "Alicia"
+
+
+def test_get_racing_patch_returns_etag_matching_body(monkeypatch):
+    import main
+    in_lookup, patched = threading.Event(), threading.Event()
+
+    def slow_lookup(id):
+        player = main.find_player(main.PLAYERS, id)
+        in_lookup.set()
+        patched.wait(timeout=5)
+        return player
+
+    monkeypatch.setattr(main, "_get_player_by_id", slow_lookup)
+    result = {}
+    t = threading.Thread(target=lambda: result.update(r=client.get("/v1/players/1")))
+    t.start()
+    assert in_lookup.wait(timeout=5)
+    client.patch("/v1/players/1", json={"weight": 99})
+    patched.set()
+    t.join()
+    r = result["r"]
+    assert r.json()["weight"] == 99
+    assert r.headers["ETag"] == '"2"'
+    cached = client.get("/v1/players/1")
+    assert cached.json()["weight"] == 99
+    assert cached.headers["ETag"] == '"2"'
+
+
+def test_concurrent_posts_allocate_unique_ids():
+    import main
+    from main import Player
+
+    def worker():
+        for _ in range(50):
+            main.post_player(Player(firstName="T", lastName="T", weight=70, height=170), Response())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    ids = [p["id"] for p in main.PLAYERS]
+    assert len(ids) == 3 + 8 * 50
+    assert len(set(ids)) == len(ids)
+
+
+def test_concurrent_if_match_increments_lose_no_updates():
+    import main
+    from fastapi import HTTPException
+    from main import UpdatePlayer
+
+    def worker():
+        done = 0
+        while done < 25:
+            etag = main._etag(1)
+            weight = main.find_player(main.PLAYERS, 1)["weight"]
+            try:
+                main.patch_player(1, UpdatePlayer(weight=weight + 1), Response(), if_match=etag)
+                done += 1
+            except HTTPException as e:
+                assert e.status_code == 412
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert main.find_player(main.PLAYERS, 1)["weight"] == 65 + 8 * 25
+
+
+def test_reads_do_not_wait_on_write_lock():
+    import main
+    result = {}
+
+    def reader():
+        result["players"] = main.get_players(isAdmin="true", sort=None, page=1, limit=10)["players"]
+
+    with main._write_lock:
+        t = threading.Thread(target=reader)
+        t.start()
+        t.join(timeout=2)
+    assert len(result["players"]) == 3
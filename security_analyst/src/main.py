@@ -1,7 +1,18 @@
 """Security analyst application."""
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import asyncio
+import json
+from itertools import islice
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+try:
+    from .store import IncidentStore  # When run as module: uvicorn src.main:app
+except ImportError:
+    from store import IncidentStore  # When run directly or via pytest with pythonpath
 
 app = FastAPI()
 
@@ -14,6 +25,7 @@ class Reporter(BaseModel):
 
 class CreateIncident(BaseModel):
     reporter: Reporter
+    severity: str | None = None
 
 class UpdateIncident(BaseModel):
     status: str | None = None
@@ -23,54 +35,137 @@ VALID_STATUS = ("open", "triaged", "resolved")
 VALID_SEVERITY = ("low", "medium", "high", "critical")
 
 
-_next_id = 4
-INCIDENTS: list[dict] = [
+# Built once and reused for every bulk line (schema compilation is the expensive part)
+_CREATE_ADAPTER = TypeAdapter(CreateIncident)
+
+STORE = IncidentStore([
     {"id": 1, "reporter": {"firstName": "Alice", "lastName": "Anderson", "email": "alice@example.com"}, "status": "open", "severity": "medium"},
     {"id": 2, "reporter": {"firstName": "Bob", "lastName": "Brown", "email": "bob@corp.com"}, "status": "open", "severity": "low"},
     {"id": 3, "reporter": {"firstName": "Carol", "lastName": "Clark", "email": "carol@acme.org"}, "status": "open", "severity": "high"},
-]
+], severities=VALID_SEVERITY)
 
 
 @app.get("/v1/incidents")
-def get_incidents(includePII: str, severity: str | None = None):
+def get_incidents(
+    includePII: str,
+    severity: str | None = None,
+    status: str | None = None,
+    reporterDomain: str | None = None,
+    cursor: int | None = Query(None, ge=0),
+    limit: int | None = Query(None, ge=1, le=1000),
+    format: str = "json",
+):
     if includePII not in ("true", "false"):
         raise HTTPException(400, "includePII must be 'true' or 'false'")
     if severity is not None and severity not in VALID_SEVERITY:
         raise HTTPException(400, "severity must be low, medium, high, or critical")
-    incidents = INCIDENTS
-    if severity is not None:
-        incidents = [i for i in incidents if i.get("severity") == severity]
-    if includePII == "true":
-        data = incidents
-    else:
-        data = [
-            {"id": i["id"], "reporter": {"firstName": i["reporter"]["firstName"]}, "status": i.get("status", "open"), "severity": i.get("severity")}
-            for i in incidents
-        ]
-    return {"incidents": data}
+    if status is not None and status not in VALID_STATUS:
+        raise HTTPException(400, "status must be open, triaged, or resolved")
+    if format not in ("json", "ndjson"):
+        raise HTTPException(400, "format must be 'json' or 'ndjson'")
+    rows = STORE.scan(after=cursor or 0, severity=severity, status=status, domain=reporterDomain)
+    if includePII == "false":
+        rows = map(STORE.redacted, rows)
+    if format == "ndjson":
+        if limit is not None:
+            rows = islice(rows, limit)
+        return StreamingResponse((json.dumps(i) + "\n" for i in rows), media_type="application/x-ndjson")
+    if limit is None:
+        return {"incidents": list(rows)}
+    # Fetch one extra row to learn whether another page exists
+    page = list(islice(rows, limit + 1))
+    next_cursor = page[limit - 1]["id"] if len(page) > limit else None
+    return {"incidents": page[:limit], "nextCursor": next_cursor}
+
 
 @app.post("/v1/incidents", status_code=201)
 def create_incident(body: CreateIncident):
-    global _next_id
-    new_incident = {"id": _next_id, **body.model_dump(exclude={"id"}), "status": "open"}
-    _next_id += 1
-    INCIDENTS.append(new_incident)
-    return new_incident
+    if body.severity is not None and body.severity not in VALID_SEVERITY:
+        raise HTTPException(400, "severity must be low, medium, high, or critical")
+    return STORE.add({**body.model_dump(exclude={"id"}), "status": "open"})
+
+
+@app.post("/v1/incidents/bulk", status_code=201)
+async def bulk_create_incidents(request: Request, dedupWindow: float | None = Query(None, ge=0)):
+    """Ingest an NDJSON batch of CreateIncident rows; the whole batch is rejected if any line is invalid."""
+    body = await request.body()
+    # Validation and the locked insert run off the event loop so SSE streams keep flowing
+    return await run_in_threadpool(_ingest_bulk, body, dedupWindow)
+
+
+def _ingest_bulk(body: bytes, dedup_window: float | None) -> dict:
+    rows = []
+    for n, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            incident = _CREATE_ADAPTER.validate_json(line)
+        except ValidationError as e:
+            raise HTTPException(422, {"line": n, "errors": e.errors(include_url=False, include_context=False, include_input=False)})
+        if incident.severity is not None and incident.severity not in VALID_SEVERITY:
+            raise HTTPException(422, {"line": n, "errors": ["severity must be low, medium, high, or critical"]})
+        rows.append({**incident.model_dump(), "status": "open"})
+    stored = STORE.add_many(rows, dedup_window=dedup_window)
+    created = sum(1 for _, new in stored if new)
+    return {"ids": [i["id"] for i, _ in stored], "created": created, "merged": len(stored) - created}
+
+
+@app.get("/v1/incidents/next")
+def claim_next_incident(includePII: str):
+    """Claim the open incident with the highest severity, oldest first, and mark it triaged."""
+    if includePII not in ("true", "false"):
+        raise HTTPException(400, "includePII must be 'true' or 'false'")
+    incident = STORE.claim_next()
+    if incident is None:
+        raise HTTPException(404, "no open incidents")
+    return incident if includePII == "true" else STORE.redacted(incident)
+
 
+async def _critical_events(after: int, interval: float):
+    """
+    SSE frames for critical incidents created after the given id, polling the critical index.
+
+    Not filtered on status: an incident claimed or resolved between polls is
+    still pushed, and the cursor ensures each id is sent at most once.
+    """
+    while True:
+        for incident in STORE.scan(after=after, severity="critical"):
+            after = incident["id"]
+            yield f"id: {after}\ndata: {json.dumps(STORE.redacted(incident))}\n\n"
+        await asyncio.sleep(interval)
+
+
+@app.get("/v1/incidents/critical/stream")
+def stream_critical_incidents(cursor: int | None = Query(None, ge=0)):
+    """Server-sent events for new critical incidents; only incidents after cursor (default: now) are pushed."""
+    after = cursor if cursor is not None else STORE.last_id()
+    return StreamingResponse(_critical_events(after, 1.0), media_type="text/event-stream")
+
+
+@app.get("/v1/incidents/stats")
+def get_incident_stats():
+    """Dashboard aggregates maintained incrementally by the store; a missing severity is reported as 'unknown'."""
+    stats = STORE.stats()
+    stats["bySeverityStatus"] = {
+        "unknown" if severity is None else severity: counts for severity, counts in stats["bySeverityStatus"].items()
+    }
+    return stats
 
-def find_incident(incidents: list[dict], id: int) -> dict | None:
-    return next((x for x in incidents if x.get("id") == id), None) 
 
 @app.patch("/v1/incidents/{id}", status_code=200)
 def patch_incident(id: int, body: UpdateIncident):
-    incident = find_incident(INCIDENTS, id)
+    incident = STORE.get(id)
     if not incident:
         raise HTTPException(404, "incident id not found")
+    changes = {}
     if body.status is not None:
         if body.status not in VALID_STATUS:
             raise HTTPException(400, "status must be open, triaged, or resolved")
-        incident["status"] = body.status
+        changes["status"] = body.status
+    if body.severity is not None:
+        if body.severity not in VALID_SEVERITY:
+            raise HTTPException(400, "severity must be low, medium, high, or critical")
+        changes["severity"] = body.severity
+    if changes:
+        incident = STORE.update(id, **changes)
     return incident
-
-
-
@@ -0,0 +1,325 @@
+"""In-memory incident store with an id index and severity/status/domain secondary indexes."""
+
+import heapq
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+
+
+def reporter_domain(incident: dict) -> str | None:
+    """Lower-cased domain of the reporter's email, or None if there is no usable email."""
+    email = (incident.get("reporter") or {}).get("email") or ""
+    _, at, domain = email.rpartition("@")
+    return domain.lower() if at and domain else None
+
+
+def redact(incident: dict) -> dict:
+    """Public projection of an incident: reporter reduced to firstName."""
+    return {
+        "id": incident["id"],
+        "reporter": {"firstName": incident["reporter"]["firstName"]},
+        "status": incident.get("status", "open"),
+        "severity": incident.get("severity"),
+    }
+
+
+INDEX_KEYS: dict[str, Callable[[dict], str | None]] = {
+    "severity": lambda i: i.get("severity"),
+    "status": lambda i: i.get("status"),
+    "domain": reporter_domain,
+}
+
+_CHUNK = 256
+
+
+class _Bucket:
+    """Incidents sharing one index value: id -> incident plus a sorted id list for cursors."""
+
+    __slots__ = ("rows", "ids")
+
+    def __init__(self):
+        self.rows: dict[int, dict] = {}
+        self.ids: list[int] = []
+
+    def add(self, incident: dict) -> None:
+        id = incident["id"]
+        if id not in self.rows:
+            if not self.ids or id > self.ids[-1]:
+                self.ids.append(id)
+            else:
+                insort(self.ids, id)
+        self.rows[id] = incident
+
+    def remove(self, id: int) -> None:
+        if self.rows.pop(id, None) is not None:
+            del self.ids[bisect_left(self.ids, id)]
+
+
+_EMPTY = _Bucket()
+
+
+class _Rollup:
+    """Event counts in fixed-width time buckets, covering only the last `retention` bucket widths."""
+
+    __slots__ = ("width", "retention", "counts")
+
+    def __init__(self, width: int, retention: int):
+        self.width = width
+        self.retention = retention
+        self.counts: dict[int, int] = {}  # bucket start -> count, oldest first for in-order adds
+
+    def add(self, ts: float, n: int = 1) -> None:
+        start = self._start(ts)
+        self.counts[start] = self.counts.get(start, 0) + n
+        cutoff = self._cutoff(ts)
+        while self.counts:
+            oldest = next(iter(self.counts))
+            if oldest >= cutoff:
+                break
+            del self.counts[oldest]
+        if len(self.counts) > self.retention:  # out-of-order adds can leave stale buckets behind
+            for old in sorted(self.counts)[: len(self.counts) - self.retention]:
+                del self.counts[old]
+
+    def snapshot(self, now: float) -> list[dict]:
+        cutoff = self._cutoff(now)
+        return [{"start": start, "count": self.counts[start]} for start in sorted(self.counts) if start >= cutoff]
+
+    def _start(self, ts: float) -> int:
+        return int(ts // self.width) * self.width
+
+    def _cutoff(self, ts: float) -> int:
+        """Start of the oldest bucket still within retention of ts."""
+        return self._start(ts) - self.width * (self.retention - 1)
+
+
+class IncidentStore:
+    """
+    Incidents keyed by id, plus one bucket per severity, status and reporter domain.
+
+    Updates are copy-on-write: the stored dict is replaced, never mutated, so
+    readers and cached projections never see a half-applied change. Filtered
+    queries walk only the smallest matching bucket, starting at the cursor.
+
+    Open incidents also sit in a triage heap ordered by severity rank (position
+    in `severities`, highest first; unknown severities rank lowest) and then by
+    age (lowest id first). Heap entries are invalidated lazily on update.
+    """
+
+    def __init__(
+        self, incidents: Iterable[dict] = (), severities: Sequence[str] = (), dedup_retention: float = 24 * 3600
+    ):
+        self._lock = threading.Lock()
+        self._all = _Bucket()
+        self._indexes: dict[str, dict[str | None, _Bucket]] = {f: {} for f in INDEX_KEYS}
+        self._redacted: dict[int, tuple[dict, dict]] = {}
+        # Lower-cased reporter email -> (id, first seen) of its latest incident, for dedup;
+        # oldest first, and pruned once older than dedup_retention seconds
+        self._recent: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self.dedup_retention = dedup_retention
+        # (severity, status) -> count, and creations per minute/hour, kept incrementally
+        self._matrix: Counter[tuple[str | None, str | None]] = Counter()
+        self._rollups = {"perMinute": _Rollup(60, 24 * 60), "perHour": _Rollup(3600, 7 * 24)}
+        self._rank = {s: r for r, s in enumerate(severities)}
+        self._queue: list[tuple[int, int]] = []  # (-rank, id)
+        self._queued: dict[int, int] = {}  # id -> rank of its live heap entry
+        self._next_id = 1
+        for incident in incidents:
+            self._insert(incident)
+
+    def __len__(self) -> int:
+        return len(self._all.rows)
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.scan()
+
+    def last_id(self) -> int:
+        """Highest id assigned so far (0 for an empty store)."""
+        return self._next_id - 1
+
+    def get(self, id: int) -> dict | None:
+        """Look up an incident by id. Returns None if not found."""
+        return self._all.rows.get(id)
+
+    def add(self, fields: dict) -> dict:
+        """Store a new incident, assigning the next id. Returns the stored incident."""
+        return self.add_many([fields])[0][0]
+
+    def add_many(
+        self, rows: Iterable[dict], dedup_window: float | None = None, now: float | None = None
+    ) -> list[tuple[dict, bool]]:
+        """
+        Store a batch of incidents under one lock acquisition, assigning consecutive ids.
+
+        With dedup_window (seconds), a row whose reporter email already opened an
+        incident within the window is merged into that incident (if still open)
+        by bumping its count instead of creating a new one. Windows longer than
+        the store's dedup_retention are effectively capped to it. Returns, per
+        row, the incident it was stored as or merged into and whether it was
+        newly created.
+        """
+        now = time.time() if now is None else now
+        results = []
+        with self._lock:
+            self._prune_recent(now)
+            for fields in rows:
+                email = ((fields.get("reporter") or {}).get("email") or "").lower()
+                if dedup_window is not None and email in self._recent:
+                    id, seen = self._recent[email]
+                    current = self._all.rows.get(id)
+                    if current is not None and current.get("status") == "open" and now - seen <= dedup_window:
+                        results.append((self._replace(current, {"count": current.get("count", 1) + 1}), False))
+                        continue
+                incident = {"id": self._next_id, **fields}
+                self._insert(incident)
+                for rollup in self._rollups.values():
+                    rollup.add(now)
+                if email:
+                    self._recent[email] = (incident["id"], now)
+                    self._recent.move_to_end(email)
+                results.append((incident, True))
+        return results
+
+    def _prune_recent(self, now: float) -> None:
+        """Drop dedup entries older than dedup_retention. Caller must hold _lock."""
+        horizon = now - self.dedup_retention
+        while self._recent:
+            email, (_, seen) = next(iter(self._recent.items()))
+            if seen >= horizon:
+                break
+            del self._recent[email]
+
+    def update(self, id: int, **changes) -> dict | None:
+        """Replace an incident with changes applied, re-indexing any changed keys."""
+        with self._lock:
+            old = self._all.rows.get(id)
+            if old is None:
+                return None
+            return self._replace(old, changes)
+
+    def scan(self, after: int = 0, **filters: str | None) -> Iterator[dict]:
+        """
+        Yield incidents with id > after matching every non-None filter, in id order.
+
+        Filters are index names (severity, status, domain). Cost is proportional
+        to the rows walked in the smallest matching bucket.
+        """
+        filters = {f: v for f, v in filters.items() if v is not None}
+        if "domain" in filters:
+            filters["domain"] = filters["domain"].lower()
+        if filters:
+            field, value = min(filters.items(), key=lambda fv: len(self._find(*fv).rows))
+            bucket = self._find(field, value)
+        else:
+            bucket = self._all
+        checks = [(INDEX_KEYS[f], v) for f, v in filters.items()]
+        pos = bisect_right(bucket.ids, after)
+        while True:
+            chunk = bucket.ids[pos : pos + _CHUNK]
+            if not chunk:
+                return
+            for id in chunk:
+                incident = bucket.rows.get(id)
+                if incident is not None and all(key(incident) == v for key, v in checks):
+                    yield incident
+            # Re-seek from the last id seen in case writers shifted the list
+            pos = bisect_right(bucket.ids, chunk[-1])
+
+    def query(self, severity: str | None = None, status: str | None = None, domain: str | None = None) -> list[dict]:
+        """All incidents matching the given filters, in id order."""
+        return list(self.scan(severity=severity, status=status, domain=domain))
+
+    def redacted(self, incident: dict) -> dict:
+        """PII-free projection of a stored incident, computed once per version."""
+        cached = self._redacted.get(incident["id"])
+        if cached is not None and cached[0] is incident:
+            return cached[1]
+        view = redact(incident)
+        self._redacted[incident["id"]] = (incident, view)
+        return view
+
+    def claim_next(self) -> dict | None:
+        """Pop the highest-priority open incident and mark it triaged. None if none are open."""
+        with self._lock:
+            while self._queue:
+                neg_rank, id = heapq.heappop(self._queue)
+                if self._queued.get(id) == -neg_rank:
+                    del self._queued[id]
+                    return self._replace(self._all.rows[id], {"status": "triaged"})
+        return None
+
+    def stats(self, now: float | None = None) -> dict:
+        """
+        Current aggregates: total, counts by severity x status, by reporter domain,
+        and per-minute (last 24h) / per-hour (last 7d) creation rollups as of now.
+        Cost depends only on the number of distinct keys and retained time
+        buckets, not on the number of incidents.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            by_severity_status: dict[str | None, dict[str | None, int]] = {}
+            for (severity, status), n in self._matrix.items():
+                if n:
+                    by_severity_status.setdefault(severity, {})[status] = n
+            by_domain = {d: len(b.rows) for d, b in self._indexes["domain"].items() if d is not None and b.rows}
+            return {
+                "total": len(self._all.rows),
+                "bySeverityStatus": by_severity_status,
+                "byDomain": by_domain,
+                **{name: rollup.snapshot(now) for name, rollup in self._rollups.items()},
+            }
+
+    def count(self, field: str, value: str | None) -> int:
+        """Number of incidents whose indexed field equals value."""
+        return len(self._find(field, value).rows)
+
+    def _replace(self, old: dict, changes: dict) -> dict:
+        id = old["id"]
+        new = {**old, **changes}
+        self._all.rows[id] = new
+        for field, key in INDEX_KEYS.items():
+            old_key, new_key = key(old), key(new)
+            if old_key != new_key:
+                self._bucket(field, old_key).remove(id)
+            self._bucket(field, new_key).add(new)
+        self._redacted.pop(id, None)
+        self._matrix[old.get("severity"), old.get("status")] -= 1
+        self._matrix[new.get("severity"), new.get("status")] += 1
+        self._enqueue(new)
+        return new
+
+    def _insert(self, incident: dict) -> None:
+        id = incident["id"]
+        self._all.add(incident)
+        for field, key in INDEX_KEYS.items():
+            self._bucket(field, key(incident)).add(incident)
+        self._matrix[incident.get("severity"), incident.get("status")] += 1
+        self._enqueue(incident)
+        self._next_id = max(self._next_id, id + 1)
+
+    def _enqueue(self, incident: dict) -> None:
+        id = incident["id"]
+        if incident.get("status") != "open":
+            self._queued.pop(id, None)
+            return
+        rank = self._rank.get(incident.get("severity"), -1)
+        if self._queued.get(id) == rank:
+            return
+        self._queued[id] = rank
+        heapq.heappush(self._queue, (-rank, id))
+        # Drop stale entries once they dominate the heap
+        if len(self._queue) > 2 * len(self._queued) + 64:
+            self._queue = [(-r, i) for i, r in self._queued.items()]
+            heapq.heapify(self._queue)
+
+    def _find(self, field: str, value: str | None) -> _Bucket:
+        return self._indexes[field].get(value, _EMPTY)
+
+    def _bucket(self, field: str, value: str | None) -> _Bucket:
+        index = self._indexes[field]
+        bucket = index.get(value)
+        if bucket is None:
+            bucket = index.setdefault(value, _Bucket())
+        return bucket
@@ -1,9 +1,13 @@
 """Security-related tests."""
 
+import asyncio
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
 from main import app  # pyright: ignore[reportMissingImports]
+from store import IncidentStore  # pyright: ignore[reportMissingImports]
 
 client = TestClient(app)
 _SEED = [
@@ -16,8 +20,7 @@ _SEED = [
 @pytest.fixture(autouse=True)
 def reset_store(monkeypatch):
     import main
-    monkeypatch.setattr(main, "INCIDENTS", [dict(i) for i in _SEED])
-    monkeypatch.setattr(main, "_next_id", 4)
+    monkeypatch.setattr(main, "STORE", IncidentStore((dict(i) for i in _SEED), severities=main.VALID_SEVERITY))
 
 
 def test_include_pii_false_returns_first_name_only():
@@ -80,7 +83,7 @@ def test_include_pii_case_sensitivity_true_rejected():
 
 def test_include_pii_empty_incidents(monkeypatch):
     import main
-    monkeypatch.setattr(main, "INCIDENTS", [])
+    monkeypatch.setattr(main, "STORE", IncidentStore())
     r = client.get("/v1/incidents", params={"includePII": "true"})
     assert r.status_code == 200
     assert r.json() == {"incidents": []}
@@ -88,7 +91,7 @@ def test_include_pii_empty_incidents(monkeypatch):
 
 def test_include_pii_reporter_missing_first_name_returns_500(monkeypatch):
     import main
-    monkeypatch.setattr(main, "INCIDENTS", [{"id": 1, "reporter": {"lastName": "X", "email": "a@b.com"}}])
+    monkeypatch.setattr(main, "STORE", IncidentStore([{"id": 1, "reporter": {"lastName": "X", "email": "a@b.com"}}]))
     no_raise = TestClient(app, raise_server_exceptions=False)
     r = no_raise.get("/v1/incidents", params={"includePII": "false"})
     assert r.status_code == 500
@@ -191,3 +194,253 @@ def test_filter_severity_empty_result():
     r = client.get("/v1/incidents", params={"includePII": "true", "severity": "critical"})
     assert r.status_code == 200
     assert r.json()["incidents"] == []
+
+
+# --- Part 5: Pagination, combined filters, streaming ---
+
+
+def test_cursor_pagination_walks_all_pages():
+    r = client.get("/v1/incidents", params={"includePII": "false", "limit": 2})
+    assert r.status_code == 200
+    page1 = r.json()
+    assert [i["id"] for i in page1["incidents"]] == [1, 2]
+    assert page1["nextCursor"] == 2
+    r = client.get("/v1/incidents", params={"includePII": "false", "limit": 2, "cursor": page1["nextCursor"]})
+    page2 = r.json()
+    assert [i["id"] for i in page2["incidents"]] == [3]
+    assert page2["nextCursor"] is None
+
+
+def test_filter_by_status():
+    client.patch("/v1/incidents/2", json={"status": "resolved"})
+    r = client.get("/v1/incidents", params={"includePII": "true", "status": "open"})
+    assert [i["id"] for i in r.json()["incidents"]] == [1, 3]
+
+
+def test_filter_invalid_status_returns_400():
+    r = client.get("/v1/incidents", params={"includePII": "true", "status": "closed"})
+    assert r.status_code == 400
+
+
+def test_filter_by_reporter_domain_case_insensitive():
+    r = client.get("/v1/incidents", params={"includePII": "true", "reporterDomain": "Corp.COM"})
+    assert [i["id"] for i in r.json()["incidents"]] == [2]
+
+
+def test_combined_filters():
+    client.post(
+        "/v1/incidents",
+        json={"reporter": {"firstName": "Dan", "lastName": "D", "email": "dan@corp.com"}},
+    )
+    client.patch("/v1/incidents/2", json={"status": "triaged"})
+    r = client.get("/v1/incidents", params={"includePII": "true", "reporterDomain": "corp.com", "status": "open"})
+    assert [i["id"] for i in r.json()["incidents"]] == [4]
+
+
+def test_ndjson_stream():
+    r = client.get("/v1/incidents", params={"includePII": "false", "format": "ndjson"})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert [i["id"] for i in lines] == [1, 2, 3]
+    assert lines[0]["reporter"] == {"firstName": "Alice"}
+
+
+def test_invalid_format_returns_400():
+    r = client.get("/v1/incidents", params={"includePII": "false", "format": "csv"})
+    assert r.status_code == 400
+
+
+def test_redacted_view_reflects_patch():
+    client.get("/v1/incidents", params={"includePII": "false"})
+    client.patch("/v1/incidents/1", json={"status": "resolved"})
+    r = client.get("/v1/incidents", params={"includePII": "false"})
+    assert r.json()["incidents"][0]["status"] == "resolved"
+
+
+# --- Part 6: Bulk ingestion ---
+
+
+def _ndjson(*rows):
+    return "\n".join(json.dumps(r) for r in rows)
+
+
+def test_bulk_create_assigns_consecutive_ids():
+    body = _ndjson(
+        {"reporter": {"firstName": "D", "lastName": "D", "email": "d@x.com"}, "severity": "high"},
+        {"reporter": {"firstName": "E", "lastName": "E", "email": "e@x.com"}},
+    )
+    r = client.post("/v1/incidents/bulk", content=body)
+    assert r.status_code == 201
+    assert r.json() == {"ids": [4, 5], "created": 2, "merged": 0}
+    r = client.get("/v1/incidents", params={"includePII": "true", "severity": "high"})
+    assert [i["id"] for i in r.json()["incidents"]] == [3, 4]
+
+
+def test_bulk_invalid_line_rejects_batch():
+    body = _ndjson(
+        {"reporter": {"firstName": "D", "lastName": "D", "email": "d@x.com"}},
+        {"reporter": {"firstName": "E"}},
+    )
+    r = client.post("/v1/incidents/bulk", content=body)
+    assert r.status_code == 422
+    assert r.json()["detail"]["line"] == 2
+    r = client.get("/v1/incidents", params={"includePII": "true"})
+    assert len(r.json()["incidents"]) == 3
+
+
+def test_bulk_invalid_severity_returns_422():
+    body = _ndjson({"reporter": {"firstName": "D", "lastName": "D", "email": "d@x.com"}, "severity": "urgent"})
+    r = client.post("/v1/incidents/bulk", content=body)
+    assert r.status_code == 422
+
+
+def test_bulk_dedup_collapses_alert_storm():
+    row = {"reporter": {"firstName": "S", "lastName": "S", "email": "siem@x.com"}, "severity": "critical"}
+    r = client.post("/v1/incidents/bulk", params={"dedupWindow": 60}, content=_ndjson(row, row, row))
+    assert r.json() == {"ids": [4, 4, 4], "created": 1, "merged": 2}
+    r = client.get("/v1/incidents", params={"includePII": "true", "severity": "critical"})
+    incidents = r.json()["incidents"]
+    assert len(incidents) == 1
+    assert incidents[0]["count"] == 3
+
+
+def test_bulk_without_dedup_keeps_duplicates():
+    row = {"reporter": {"firstName": "S", "lastName": "S", "email": "siem@x.com"}}
+    r = client.post("/v1/incidents/bulk", content=_ndjson(row, row))
+    assert r.json()["created"] == 2
+
+
+def test_bulk_inserts_off_the_event_loop(monkeypatch):
+    import main
+    calls = []
+    add_many = main.STORE.add_many
+
+    def spy(rows, **kw):
+        try:
+            asyncio.get_running_loop()
+            calls.append("event loop")
+        except RuntimeError:
+            calls.append("worker thread")
+        return add_many(rows, **kw)
+
+    monkeypatch.setattr(main.STORE, "add_many", spy)
+    row = {"reporter": {"firstName": "S", "lastName": "S", "email": "siem@x.com"}}
+    r = client.post("/v1/incidents/bulk", content=_ndjson(row))
+    assert r.status_code == 201
+    assert calls == ["worker thread"]
+
+
+def test_create_invalid_severity_returns_400():
+    r = client.post(
+        "/v1/incidents",
+        json={"reporter": {"firstName": "X", "lastName": "Y", "email": "x@y.com"}, "severity": "urgent"},
+    )
+    assert r.status_code == 400
+
+
+# --- Part 7: Triage queue ---
+
+
+def _create(email, severity=None):
+    body = {"reporter": {"firstName": "N", "lastName": "N", "email": email}}
+    if severity:
+        body["severity"] = severity
+    return client.post("/v1/incidents", json=body).json()
+
+
+def test_claim_next_orders_by_severity_then_age():
+    _create("a@x.com", "high")
+    claimed = [client.get("/v1/incidents/next", params={"includePII": "true"}).json()["id"] for _ in range(4)]
+    assert claimed == [3, 4, 1, 2]
+
+
+def test_claim_next_marks_triaged_and_empties_queue():
+    for _ in range(3):
+        r = client.get("/v1/incidents/next", params={"includePII": "false"})
+        assert r.json()["status"] == "triaged"
+        assert "email" not in r.json()["reporter"]
+    r = client.get("/v1/incidents/next", params={"includePII": "false"})
+    assert r.status_code == 404
+
+
+def test_claim_next_skips_resolved_and_sees_reopened():
+    client.patch("/v1/incidents/3", json={"status": "resolved"})
+    r = client.get("/v1/incidents/next", params={"includePII": "true"})
+    assert r.json()["id"] == 1
+    client.patch("/v1/incidents/3", json={"status": "open"})
+    r = client.get("/v1/incidents/next", params={"includePII": "true"})
+    assert r.json()["id"] == 3
+
+
+def test_patch_severity_reprioritizes():
+    client.patch("/v1/incidents/2", json={"severity": "critical"})
+    r = client.get("/v1/incidents/next", params={"includePII": "true"})
+    assert r.json()["id"] == 2
+    assert r.json()["severity"] == "critical"
+
+
+def test_patch_invalid_severity_returns_400():
+    r = client.patch("/v1/incidents/1", json={"severity": "urgent"})
+    assert r.status_code == 400
+
+
+def test_critical_events_push_new_critical_only():
+    import main
+
+    async def first_event():
+        events = main._critical_events(after=3, interval=0.01)
+        try:
+            return await asyncio.wait_for(events.__anext__(), timeout=2)
+        finally:
+            await events.aclose()
+
+    _create("low@x.com", "low")
+    _create("crit@x.com", "critical")
+    frame = asyncio.run(first_event())
+    assert frame.startswith("id: 5\n")
+    assert json.loads(frame.split("data: ", 1)[1])["severity"] == "critical"
+
+
+def test_critical_events_include_incidents_claimed_before_poll():
+    import main
+
+    async def first_event():
+        events = main._critical_events(after=3, interval=0.01)
+        try:
+            return await asyncio.wait_for(events.__anext__(), timeout=2)
+        finally:
+            await events.aclose()
+
+    _create("crit@x.com", "critical")
+    assert client.get("/v1/incidents/next", params={"includePII": "false"}).json()["id"] == 4
+    frame = asyncio.run(first_event())
+    assert frame.startswith("id: 4\n")
+    assert json.loads(frame.split("data: ", 1)[1])["status"] == "triaged"
+
+
+# --- Part 8: Stats ---
+
+
+def test_stats_counts_by_severity_status_and_domain():
+    _create("dan@corp.com", "low")
+    client.patch("/v1/incidents/1", json={"status": "resolved"})
+    r = client.get("/v1/incidents/stats")
+    assert r.status_code == 200
+    data = r.json()
+    assert data["total"] == 4
+    assert data["bySeverityStatus"] == {
+        "medium": {"resolved": 1},
+        "low": {"open": 2},
+        "high": {"open": 1},
+    }
+    assert data["byDomain"] == {"example.com": 1, "corp.com": 2, "acme.org": 1}
+
+
+def test_stats_rollups_count_new_incidents():
+    _create("a@x.com")
+    _create("b@x.com", "high")
+    data = client.get("/v1/incidents/stats").json()
+    assert sum(b["count"] for b in data["perMinute"]) == 2
+    assert sum(b["count"] for b in data["perHour"]) == 2
+    assert data["bySeverityStatus"]["unknown"] == {"open": 1}
@@ -0,0 +1,179 @@
+"""Unit tests for the indexed incident store."""
+
+from store import IncidentStore  # pyright: ignore[reportMissingImports]
+
+
+def _store():
+    return IncidentStore(
+        [
+            {"id": 1, "status": "open", "severity": "high"},
+            {"id": 2, "status": "open", "severity": "low"},
+            {"id": 3, "status": "resolved", "severity": "high"},
+        ]
+    )
+
+
+def test_get_by_id():
+    store = _store()
+    assert store.get(2)["severity"] == "low"
+    assert store.get(99) is None
+
+
+def test_add_assigns_next_id():
+    store = _store()
+    incident = store.add({"status": "open", "severity": "critical"})
+    assert incident["id"] == 4
+    assert store.get(4) is incident
+    assert len(store) == 4
+
+
+def test_add_to_empty_store_starts_at_one():
+    assert IncidentStore().add({"status": "open"})["id"] == 1
+
+
+def test_query_by_severity():
+    assert [i["id"] for i in _store().query(severity="high")] == [1, 3]
+
+
+def test_query_by_status_and_severity():
+    assert [i["id"] for i in _store().query(severity="high", status="open")] == [1]
+
+
+def test_query_without_filters_returns_all():
+    assert [i["id"] for i in _store().query()] == [1, 2, 3]
+
+
+def test_update_moves_between_status_buckets():
+    store = _store()
+    store.update(1, status="resolved")
+    assert [i["id"] for i in store.query(status="open")] == [2]
+    assert [i["id"] for i in store.query(status="resolved")] == [1, 3]
+    assert store.count("status", "resolved") == 2
+
+
+def test_update_missing_returns_none():
+    assert _store().update(99, status="open") is None
+
+
+def test_update_same_value_keeps_bucket():
+    store = _store()
+    store.update(2, status="open")
+    assert [i["id"] for i in store.query(status="open")] == [1, 2]
+
+
+def test_scan_after_cursor():
+    assert [i["id"] for i in _store().scan(after=1)] == [2, 3]
+    assert [i["id"] for i in _store().scan(after=1, severity="high")] == [3]
+
+
+def test_query_by_domain():
+    store = IncidentStore(
+        [
+            {"id": 1, "reporter": {"email": "a@Corp.com"}},
+            {"id": 2, "reporter": {"email": "b@acme.org"}},
+            {"id": 3, "reporter": {}},
+        ]
+    )
+    assert [i["id"] for i in store.query(domain="corp.com")] == [1]
+    assert [i["id"] for i in store.query(domain="unknown.com")] == []
+
+
+def test_update_is_copy_on_write():
+    store = _store()
+    before = store.get(1)
+    after = store.update(1, status="triaged")
+    assert before["status"] == "open"
+    assert after["status"] == "triaged"
+    assert store.get(1) is after
+
+
+def test_redacted_cached_until_update():
+    store = IncidentStore([{"id": 1, "reporter": {"firstName": "A", "email": "a@b.com"}, "status": "open"}])
+    view = store.redacted(store.get(1))
+    assert store.redacted(store.get(1)) is view
+    store.update(1, status="resolved")
+    fresh = store.redacted(store.get(1))
+    assert fresh is not view
+    assert fresh["status"] == "resolved"
+
+
+def test_add_many_dedup_respects_window():
+    store = IncidentStore()
+    row = {"reporter": {"email": "A@x.com"}, "status": "open"}
+    store.add_many([row], dedup_window=10, now=100.0)
+    (merged, created), = store.add_many([row], dedup_window=10, now=105.0)
+    assert created is False
+    assert merged["count"] == 2
+    (fresh, created), = store.add_many([row], dedup_window=10, now=200.0)
+    assert created is True
+    assert fresh["id"] == 2
+
+
+def test_add_many_dedup_skips_closed_incidents():
+    store = IncidentStore()
+    row = {"reporter": {"email": "a@x.com"}, "status": "open"}
+    store.add_many([row], dedup_window=10, now=100.0)
+    store.update(1, status="resolved")
+    (incident, created), = store.add_many([row], dedup_window=10, now=101.0)
+    assert created is True
+    assert incident["id"] == 2
+
+
+def test_add_many_prunes_expired_dedup_entries():
+    store = IncidentStore(dedup_retention=60)
+    store.add_many([{"reporter": {"email": f"u{i}@x.com"}} for i in range(3)], now=100.0)
+    store.add_many([{"reporter": {"email": "late@x.com"}}], now=150.0)
+    assert len(store._recent) == 4
+    store.add_many([], now=200.0)
+    assert list(store._recent) == ["late@x.com"]
+    (incident, created), = store.add_many([{"reporter": {"email": "u0@x.com"}}], dedup_window=1000, now=201.0)
+    assert created is True
+
+
+def test_claim_next_priority_and_lazy_invalidation():
+    store = IncidentStore(
+        [
+            {"id": 1, "status": "open", "severity": "low"},
+            {"id": 2, "status": "open", "severity": "high"},
+            {"id": 3, "status": "open", "severity": "high"},
+        ],
+        severities=("low", "high"),
+    )
+    store.update(2, severity="low")
+    assert store.claim_next()["id"] == 3
+    assert store.claim_next()["id"] == 1
+    assert store.claim_next()["id"] == 2
+    assert store.claim_next() is None
+    assert store.get(1)["status"] == "triaged"
+
+
+def test_stats_track_transitions():
+    store = _store()
+    store.update(1, status="resolved", severity="low")
+    stats = store.stats()
+    assert stats["total"] == 3
+    assert stats["bySeverityStatus"] == {"low": {"open": 1, "resolved": 1}, "high": {"resolved": 1}}
+
+
+def test_stats_rollups_bucket_by_time():
+    store = IncidentStore()
+    store.add_many([{"status": "open"}, {"status": "open"}], now=120.0)
+    store.add_many([{"status": "open"}], now=185.0)
+    stats = store.stats(now=185.0)
+    assert stats["perMinute"] == [{"start": 120, "count": 2}, {"start": 180, "count": 1}]
+    assert stats["perHour"] == [{"start": 0, "count": 3}]
+
+
+def test_stats_rollups_retain_by_time_not_bucket_count():
+    store = IncidentStore()
+    day = 24 * 3600
+    store.add_many([{"status": "open"}], now=0.0)
+    store.add_many([{"status": "open"}], now=30 * day)
+    stats = store.stats(now=30 * day)
+    assert stats["perMinute"] == [{"start": 30 * day, "count": 1}]
+    assert stats["perHour"] == [{"start": 30 * day, "count": 1}]
+    store.add_many([{"status": "open"}], now=30 * day + 3 * 3600)
+    stats = store.stats(now=32 * day)
+    assert stats["perMinute"] == []
+    assert [b["count"] for b in stats["perHour"]] == [1, 1]
+    assert store.stats(now=40 * day)["perHour"] == []
@@ -2,9 +2,9 @@ import argparse
 import sys
 
 try:
-    from .utils import parse_config  # When run as module: python -m src.main
+    from .utils import get_config_service  # When run as module: python -m src.main
 except ImportError:
-    from utils import parse_config  # When run directly or via pytest with pythonpath
+    from utils import get_config_service  # When run directly or via pytest with pythonpath
 
 
 def greet(name: str) -> str:
@@ -22,7 +22,8 @@ def main(argv: list[str] | None = None) -> None:
     args = parser.parse_args(argv)
 
     print(greet("World"))
-    config = parse_config(args.config)
+    # check_interval=0: each call sees the file as it is now (one stat when unchanged)
+    config = get_config_service(args.config, check_interval=0).snapshot()
     if "message" in config:
         print(config["message"])
     print("Template ready")
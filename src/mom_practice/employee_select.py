@@ -1,27 +1,25 @@
+import csv
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from typing import List
 
+EMPLOYEES_FILE = Path(__file__).resolve().parent / "employees.txt"
+
 
 class Employee:
+    __slots__ = ("name", "employee_id", "age")
+
     def __init__(self, name: str, employee_id: int, age: int):
         self.name = name
         self.employee_id = employee_id
         self.age = age
 
+    def __repr__(self) -> str:
+        return f"Employee({self.name!r}, {self.employee_id}, {self.age})"
 
-def read_names_from_txt(file_path: str):
-
-    path = Path(file_path)
-    employees = []
-
-    with path.open(encoding="utf-8") as f:
 
-        for line in f:
-            parts = line.strip().split(",")
-            name, employee_id, age = parts[0].strip(), parts[1].strip(), parts[2].strip()
-            if name:
-                employees.append(Employee(name, int(employee_id), int(age)))
-    return employees
+def read_names_from_txt(file_path: str):
+    return list(_read_employees(Path(file_path)))
 
 
 def sort_list(list: List[str]):
@@ -30,11 +28,101 @@ def sort_list(list: List[str]):
 def employee_exist(list: List[str], name: str):
     return name in list
 
-employees = read_names_from_txt("employees.txt")
 
+class EmployeeDirectory:
+    """
+    Employees from a "name, id, age" file, loaded on first use.
+
+    Keeps hash indexes on id and name, a sorted name index for O(log n)
+    lookup and prefix queries, and an age-sorted index for age ranges.
+    """
+
+    def __init__(self, file_path: str | Path = EMPLOYEES_FILE):
+        self.file_path = Path(file_path)
+        self._loaded = False
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._by_id)
+
+    def __iter__(self):
+        self._load()
+        return iter(self._by_id.values())
+
+    def __contains__(self, name: str) -> bool:
+        return self.exists(name)
+
+    def get(self, employee_id: int) -> Employee | None:
+        """Employee with the given id, or None."""
+        self._load()
+        return self._by_id.get(employee_id)
+
+    def find(self, name: str) -> list[Employee]:
+        """All employees with exactly this name."""
+        self._load()
+        return list(self._by_name.get(name, ()))
+
+    def exists(self, name: str) -> bool:
+        """True if any employee has this name (binary search over the sorted names)."""
+        self._load()
+        i = bisect_left(self._names, name)
+        return i < len(self._names) and self._names[i] == name
+
+    def sorted_names(self) -> list[str]:
+        """All names in sorted order, including repeats."""
+        self._load()
+        return list(self._names)
+
+    def with_prefix(self, prefix: str) -> list[Employee]:
+        """Employees whose name starts with prefix, in name order."""
+        self._load()
+        lo = bisect_left(self._names, prefix)
+        hi = bisect_left(self._names, prefix + "\U0010ffff", lo)
+        return self._by_sorted_name[lo:hi]
+
+    def age_between(self, low: int, high: int) -> list[Employee]:
+        """Employees with low <= age <= high, youngest first."""
+        self._load()
+        lo = bisect_left(self._ages, low)
+        hi = bisect_right(self._ages, high, lo)
+        return self._by_sorted_age[lo:hi]
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._by_id: dict[int, Employee] = {}
+        self._by_name: dict[str, list[Employee]] = {}
+        for employee in _read_employees(self.file_path):
+            if employee.employee_id in self._by_id:
+                raise ValueError(f"{self.file_path}: duplicate employee id {employee.employee_id}")
+            self._by_id[employee.employee_id] = employee
+            self._by_name.setdefault(employee.name, []).append(employee)
+        self._by_sorted_name = sorted(self._by_id.values(), key=lambda e: (e.name, e.employee_id))
+        self._names = [e.name for e in self._by_sorted_name]
+        self._by_sorted_age = sorted(self._by_id.values(), key=lambda e: (e.age, e.employee_id))
+        self._ages = [e.age for e in self._by_sorted_age]
+        self._loaded = True
+
+
+def _read_employees(path: Path):
+    """Stream Employee records from a "name, id, age" CSV file, skipping blank lines and rows without a name."""
+    with path.open(encoding="utf-8", newline="") as f:
+        for line_no, row in enumerate(csv.reader(f, skipinitialspace=True), start=1):
+            if not row:
+                continue
+            if len(row) != 3:
+                raise ValueError(f"{path}:{line_no}: expected 'name, id, age', got {row!r}")
+            name, employee_id, age = (part.strip() for part in row)
+            if not name:
+                continue
+            try:
+                employee = Employee(name, int(employee_id), int(age))
+            except ValueError:
+                raise ValueError(f"{path}:{line_no}: id and age must be integers, got {row!r}") from None
+            yield employee
 
-sorted_names = sort_list(employees.name)
-print(sorted_names)
 
-selected_name = employee_exist(sorted_names, "James")
-print(selected_name)
\ No newline at end of file
+if __name__ == "__main__":
+    directory = EmployeeDirectory()
+    print(directory.sorted_names())
+    print(directory.exists("James"))
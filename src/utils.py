@@ -1,5 +1,17 @@
 import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigError(ValueError):
+    """Config failed to parse or did not match its schema."""
 
 
 def parse_config(path: str) -> dict:
@@ -7,3 +19,174 @@ def parse_config(path: str) -> dict:
         return {}
     with open(path, encoding="utf-8") as f:
         return json.load(f)
+
+
+# path -> ((mtime_ns, size, inode), parsed config); only re-parsed when the stat changes
+_file_cache: dict[str, tuple[tuple[int, int, int] | None, dict]] = {}
+
+
+def load_config_cached(path: str) -> dict:
+    """
+    parse_config with a cache keyed by path and (mtime, size, inode).
+
+    Costs one stat() when the file is unchanged. The returned dict is shared
+    between callers and must be treated as read-only.
+    """
+    stamp = _stat_stamp(path)
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    config = parse_config(path) if stamp is not None else {}
+    _file_cache[path] = (stamp, config)
+    return config
+
+
+class ConfigService:
+    """
+    Layered, validated config with cheap hot-reload for long-running processes.
+
+    Layers are JSON files merged in order (later files win, nested objects are
+    merged key by key); missing files count as empty. Environment variables
+    named <env_prefix><KEY> override the result, with "__" separating nested
+    keys (APP_DB__HOST -> {"db": {"host": ...}}) and values parsed as JSON
+    when possible. `schema` maps keys to the expected type(s); keys listed in
+    `required` must be present.
+
+    Reads come from an immutable snapshot. At most once per `check_interval`
+    seconds a read stats the layer files and rebuilds the snapshot if any
+    changed. A reload that fails to parse or validate keeps the last good
+    snapshot and logs a warning; only the initial load raises.
+    """
+
+    def __init__(
+        self,
+        paths: list[str] | str,
+        schema: Mapping[str, type | tuple[type, ...]] | None = None,
+        required: tuple[str, ...] = (),
+        env_prefix: str | None = None,
+        check_interval: float = 1.0,
+    ):
+        self.paths = [paths] if isinstance(paths, str) else list(paths)
+        self.schema = dict(schema or {})
+        self.required = required
+        self.env_prefix = env_prefix
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._fingerprint = None
+        self._next_check = 0.0
+        self._snapshot: Mapping = MappingProxyType({})
+        self.reload(strict=True)
+
+    def get(self, key: str, default=None):
+        """Value for a dotted key such as "db.host", or default."""
+        value = self.snapshot()
+        for part in key.split("."):
+            if not isinstance(value, Mapping) or part not in value:
+                return default
+            value = value[part]
+        return value
+
+    def snapshot(self) -> Mapping:
+        """Current merged config as a read-only mapping."""
+        if time.monotonic() >= self._next_check:
+            self.reload()
+        return self._snapshot
+
+    def reload(self, strict: bool = False) -> bool:
+        """Rebuild the snapshot if any layer or override changed. Returns True if it changed."""
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            env = self._env_overrides()
+            try:
+                fingerprint = (tuple(_stat_stamp(p) for p in self.paths), tuple(sorted(env.items())))
+                if fingerprint == self._fingerprint:
+                    return False
+                merged: dict = {}
+                for path in self.paths:
+                    try:
+                        layer = load_config_cached(path)
+                    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+                        raise ConfigError(f"{path}: {e}") from e
+                    if not isinstance(layer, dict):
+                        raise ConfigError(f"{path}: top level must be a JSON object")
+                    _deep_merge(merged, layer)
+                for name, raw in env.items():
+                    _set_nested(merged, name[len(self.env_prefix) :].lower().split("__"), _parse_env(raw))
+                self._validate(merged)
+            except (ConfigError, OSError):
+                if strict:
+                    raise
+                logger.warning("Config reload failed; keeping previous config", exc_info=True)
+                return False
+            self._fingerprint = fingerprint
+            self._snapshot = _freeze(merged)
+            return True
+
+    def _env_overrides(self) -> dict[str, str]:
+        if not self.env_prefix:
+            return {}
+        return {k: v for k, v in os.environ.items() if k.startswith(self.env_prefix)}
+
+    def _validate(self, config: dict) -> None:
+        missing = [k for k in self.required if k not in config]
+        if missing:
+            raise ConfigError(f"missing required config key(s): {', '.join(missing)}")
+        for key, expected in self.schema.items():
+            if key in config and not isinstance(config[key], expected):
+                names = expected.__name__ if isinstance(expected, type) else " or ".join(t.__name__ for t in expected)
+                raise ConfigError(f"config key {key!r} must be {names}, got {type(config[key]).__name__}")
+
+
+_services: dict[tuple[str, float], ConfigService] = {}
+
+
+def get_config_service(path: str, check_interval: float = 1.0) -> ConfigService:
+    """
+    Shared ConfigService for a single config file, created on first use.
+
+    Pass check_interval=0 where every read must see the file as it is now.
+    """
+    key = (path, check_interval)
+    service = _services.get(key)
+    if service is None:
+        service = _services.setdefault(key, ConfigService(path, check_interval=check_interval))
+    return service
+
+
+def _stat_stamp(path: str) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _deep_merge(base: dict, layer: dict) -> None:
+    # Nested dicts are always copied: layers are shared with _file_cache and must not be aliased
+    for key, value in layer.items():
+        if isinstance(value, dict):
+            child = dict(base[key]) if isinstance(base.get(key), dict) else {}
+            _deep_merge(child, value)
+            base[key] = child
+        else:
+            base[key] = value
+
+
+def _freeze(config: dict) -> Mapping:
+    """Read-only view of config with nested dicts wrapped as well."""
+    return MappingProxyType({k: _freeze(v) if isinstance(v, dict) else v for k, v in config.items()})
+
+
+def _set_nested(config: dict, keys: list[str], value) -> None:
+    for key in keys[:-1]:
+        child = config.get(key)
+        config[key] = child = dict(child) if isinstance(child, dict) else {}
+        config = child
+    config[keys[-1]] = value
+
+
+def _parse_env(raw: str):
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return raw
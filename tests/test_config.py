@@ -0,0 +1,129 @@
+import json
+import os
+
+import pytest
+
+from utils import ConfigError, ConfigService, load_config_cached
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_load_config_cached_reuses_parse_until_file_changes(tmp_path):
+    cfg = tmp_path / "config.json"
+    _write(cfg, {"message": "a"})
+    first = load_config_cached(str(cfg))
+    assert load_config_cached(str(cfg)) is first
+    _write(cfg, {"message": "bb"})
+    _bump_mtime(cfg)
+    assert load_config_cached(str(cfg)) == {"message": "bb"}
+
+
+def test_load_config_cached_missing_file(tmp_path):
+    assert load_config_cached(str(tmp_path / "missing.json")) == {}
+
+
+def test_layers_merge_in_order(tmp_path):
+    base, local = tmp_path / "base.json", tmp_path / "local.json"
+    _write(base, {"message": "base", "db": {"host": "h", "port": 1}})
+    _write(local, {"db": {"port": 2}})
+    svc = ConfigService([str(base), str(local), str(tmp_path / "missing.json")])
+    assert svc.get("message") == "base"
+    assert svc.get("db.port") == 2
+    assert svc.get("db.host") == "h"
+    assert svc.get("db.user", "default") == "default"
+
+
+def test_env_overrides(tmp_path, monkeypatch):
+    cfg = tmp_path / "config.json"
+    _write(cfg, {"db": {"port": 1}})
+    monkeypatch.setenv("APP_DB__PORT", "5432")
+    monkeypatch.setenv("APP_MESSAGE", "from env")
+    svc = ConfigService(str(cfg), env_prefix="APP_")
+    assert svc.get("db.port") == 5432
+    assert svc.get("message") == "from env"
+
+
+def test_snapshot_is_read_only(tmp_path):
+    cfg = tmp_path / "config.json"
+    _write(cfg, {"message": "hi"})
+    snap = ConfigService(str(cfg)).snapshot()
+    with pytest.raises(TypeError):
+        snap["message"] = "changed"
+
+
+def test_hot_reload_on_change(tmp_path):
+    cfg = tmp_path / "config.json"
+    _write(cfg, {"message": "old"})
+    svc = ConfigService(str(cfg), check_interval=0)
+    assert svc.get("message") == "old"
+    _write(cfg, {"message": "new"})
+    _bump_mtime(cfg)
+    assert svc.get("message") == "new"
+
+
+def test_check_interval_skips_stat(tmp_path):
+    cfg = tmp_path / "config.json"
+    _write(cfg, {"message": "old"})
+    svc = ConfigService(str(cfg), check_interval=3600)
+    _write(cfg, {"message": "new"})
+    _bump_mtime(cfg)
+    assert svc.get("message") == "old"
+    assert svc.reload() is True
+    assert svc.get("message") == "new"
+
+
+def test_schema_validation(tmp_path):
+    cfg = tmp_path / "config.json"
+    _write(cfg, {"port": "80"})
+    with pytest.raises(ConfigError):
+        ConfigService(str(cfg), schema={"port": int})
+    with pytest.raises(ConfigError):
+        ConfigService(str(cfg), required=("message",))
+
+
+def test_bad_reload_keeps_previous_config(tmp_path):
+    cfg = tmp_path / "config.json"
+    _write(cfg, {"message": "good"})
+    svc = ConfigService(str(cfg), check_interval=0)
+    cfg.write_text("{ invalid", encoding="utf-8")
+    _bump_mtime(cfg)
+    assert svc.get("message") == "good"
+
+
+@pytest.mark.parametrize("corrupt", ["bytes", "directory"])
+def test_unreadable_reload_keeps_previous_config(tmp_path, corrupt):
+    cfg = tmp_path / "config.json"
+    _write(cfg, {"message": "good"})
+    svc = ConfigService(str(cfg), check_interval=0)
+    if corrupt == "bytes":
+        cfg.write_bytes(b'{"message": "\xff\xfe"}')
+        _bump_mtime(cfg)
+    else:
+        cfg.unlink()
+        cfg.mkdir()
+    assert svc.get("message") == "good"
+
+
+def test_nested_values_do_not_alias_file_cache(tmp_path):
+    cfg = tmp_path / "config.json"
+    _write(cfg, {"db": {"host": "h"}})
+    svc = ConfigService(str(cfg), check_interval=0)
+    with pytest.raises(TypeError):
+        svc.get("db")["host"] = "changed"
+    assert load_config_cached(str(cfg))["db"] is not svc.get("db")
+    assert svc.reload(strict=True) is False
+    assert ConfigService(str(cfg)).get("db.host") == "h"
+
+
+def test_initial_invalid_json_raises(tmp_path):
+    cfg = tmp_path / "config.json"
+    cfg.write_text("{ invalid }", encoding="utf-8")
+    with pytest.raises(ConfigError):
+        ConfigService(str(cfg))
@@ -0,0 +1,68 @@
+import pytest
+
+from mom_practice.employee_select import EmployeeDirectory, read_names_from_txt
+
+
+@pytest.fixture
+def directory():
+    return EmployeeDirectory()
+
+
+def test_loads_bundled_file_lazily(directory):
+    assert directory._loaded is False
+    assert len(directory) == 11
+    assert directory._loaded is True
+
+
+def test_read_names_skips_blank_lines():
+    from mom_practice.employee_select import EMPLOYEES_FILE
+
+    employees = read_names_from_txt(str(EMPLOYEES_FILE))
+    assert [e.name for e in employees][:2] == ["Echo", "Adam"]
+
+
+def test_exists_and_sorted_names(directory):
+    assert directory.exists("James") is True
+    assert "Zed" not in directory
+    names = directory.sorted_names()
+    assert names == sorted(names)
+    assert names.count("Echo") == 2
+
+
+def test_lookup_by_id_and_name(directory):
+    assert directory.get(4).name == "James"
+    assert directory.get(99) is None
+    assert [e.employee_id for e in directory.find("Echo")] == [1, 7]
+
+
+def test_prefix_query(directory):
+    assert [e.name for e in directory.with_prefix("E")] == ["Echo", "Echo"]
+    assert [e.name for e in directory.with_prefix("Ch")] == ["Charles"]
+    assert directory.with_prefix("Q") == []
+
+
+def test_age_range_query(directory):
+    assert [e.age for e in directory.age_between(40, 45)] == [42, 43, 45]
+    assert directory.age_between(80, 90) == []
+
+
+def test_malformed_row_raises(tmp_path):
+    path = tmp_path / "employees.txt"
+    path.write_text("Ann, 1, 30\nBob, 2\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=":2:"):
+        len(EmployeeDirectory(path))
+
+
+@pytest.mark.parametrize("row", ["Bob, x, 40", "Bob, 2, forty"])
+def test_non_integer_field_raises_with_line(tmp_path, row):
+    path = tmp_path / "employees.txt"
+    path.write_text(f"Ann, 1, 30\n{row}\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=r"employees\.txt:2: id and age must be integers"):
+        len(EmployeeDirectory(path))
+
+
+def test_duplicate_id_raises(tmp_path):
+    path = tmp_path / "employees.txt"
+    path.write_text("Ann, 1, 30\nBob, 1, 40\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="duplicate"):
+        len(EmployeeDirectory(path))
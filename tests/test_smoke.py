@@ -148,3 +148,14 @@ def test_main_passes_argv_to_argparse(tmp_path, capsys):
     assert "from alt" in out
     assert "Hello, World!" in out
     assert "Template ready" in out
+
+
+def test_main_sees_config_edits_between_calls(tmp_path, capsys):
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_text('{"message": "first"}', encoding="utf-8")
+    main(argv=["--config", str(cfg_file)])
+    cfg_file.write_text('{"message": "second one"}', encoding="utf-8")
+    main(argv=["--config", str(cfg_file)])
+    out = capsys.readouterr().out
+    assert "first" in out
+    assert "second one" in out